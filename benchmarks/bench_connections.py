@@ -0,0 +1,47 @@
+"""Requests per second and connection reuse of the shared Netzverb session against the local
+stand-in server, with and without keep-alive. python benchmarks/bench_connections.py --requests 400"""
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from common import setup, report
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.01, help="server seconds per request")
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    setup()
+    from requests import get
+    from netz_server import NetzServer
+    from services.netz_client import NetzClient
+
+    server = NetzServer(latency=args.latency).start()
+    urls = [f"{server.url}/?w=Wort{i}" for i in range(args.requests)]
+    options = {"rate": 10_000, "burst": 10_000, "max_in_flight": args.threads, "pool_size": args.threads, "cache": False}
+    print(f"[INFO] Stand-in server at {server.url}, {args.latency * 1000:.0f} ms per request, {args.threads} threads")
+
+    def fetch_all(fetch: callable):
+        server.reset()
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor: list(executor.map(fetch, urls))
+        return perf_counter() - start
+
+    runs = {
+        "requests.get per call (before 007)": lambda url: get(url, timeout=15).content,
+        "shared session, new connection per request": None,
+        "shared session, keep-alive pool": lambda url: NetzClient.get(url),
+    }
+    for label, fetch in runs.items():
+        NetzClient._session = None
+        NetzClient.configure(options)
+        if fetch is None: # same session, the server is asked to close after every answer
+            NetzClient.session().headers["Connection"] = "close"
+            fetch = lambda url: NetzClient.get(url)
+        report(label, fetch_all(fetch), args.requests, unit="req")
+        print(f"       {server.stats['requests']} requests over {server.stats['connections']} connections")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
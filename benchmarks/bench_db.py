@@ -0,0 +1,59 @@
+"""Per-operation latency of small reads and single-row writes: a new sqlite3 connection per call
+on a rollback-journal database, as DBManager did before, against the shared WAL connections of
+ConnectionManager. python benchmarks/bench_db.py --rows 100000 --calls 2000"""
+import sqlite3
+from argparse import ArgumentParser
+from random import Random
+from common import setup, vocabulary, measure, report
+
+BASELINE_TABLE = """CREATE TABLE IF NOT EXISTS vocabulary (
+    type TEXT NOT NULL, german TEXT NOT NULL, translation TEXT, second_translation TEXT,
+    example TEXT, meaning TEXT, score INTEGER NOT NULL DEFAULT 0);"""
+COLUMNS = ("type", "german", "translation", "second_translation", "example", "meaning", "score")
+READ = "SELECT rowid, * FROM vocabulary WHERE rowid = ?;"
+WRITE = "UPDATE vocabulary SET score = ? WHERE rowid = ?;"
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    home = setup()
+    from services.DB_manager import DBManager
+    rows = vocabulary(args.rows)
+    db = DBManager()
+    for start in range(0, len(rows), 10_000): db.insert_data(rows[start:start + 10_000])
+
+    baseline = home / "baseline.db" # schema and journal mode of the original DBManager
+    with sqlite3.connect(baseline) as connection:
+        connection.execute(BASELINE_TABLE)
+        connection.executemany(f"INSERT INTO vocabulary VALUES ({', '.join('?' * len(COLUMNS))});",
+                               [tuple(row[column] for column in COLUMNS) for row in rows])
+    rng = Random(1)
+    rowids = [rng.randint(1, args.rows) for _ in range(args.calls)]
+
+    def connect_per_call(query: str, params: callable):
+        def run():
+            for rowid in rowids:
+                connection = sqlite3.connect(baseline)
+                connection.execute(query, params(rowid)).fetchall()
+                connection.commit()
+                connection.close()
+        return run
+
+    def shared_read():
+        for rowid in rowids:
+            with db.conn.read() as connection: connection.execute(READ, (rowid,)).fetchall()
+
+    def shared_write():
+        for rowid in rowids:
+            with db.conn.write() as connection: connection.execute(WRITE, (rowid % 4, rowid))
+
+    report("read, connection per call (before 001)", measure(connect_per_call(READ, lambda rowid: (rowid,)), 3), args.calls, "call")
+    report("read, shared connection", measure(shared_read, 3), args.calls, "call")
+    report("write, connection per call (before 001)", measure(connect_per_call(WRITE, lambda rowid: (rowid % 4, rowid)), 3), args.calls, "call")
+    report("write, shared WAL connection", measure(shared_write, 3), args.calls, "call")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Memory of DFManager.data: memory_usage(deep=True) of the vocabulary frame with object dtypes,
+with compact dtypes, and with the long texts the table hides left out.
+python benchmarks/bench_memory.py --rows 100000"""
+from argparse import ArgumentParser
+from common import setup, vocabulary
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup()
+    from services.DB_manager import DBManager
+    db = DBManager()
+    rows = vocabulary(args.rows)
+    for start in range(0, len(rows), 10_000): db.insert_data(rows[start:start + 10_000])
+
+    without_example = [column for column in db.table_columns() if column != "example"] # shipped "columns" setting
+    frames = {
+        "object dtypes, all columns (before 025)": db.to_dataframe(),
+        "compact dtypes, all columns": db.to_dataframe(compact=True),
+        "compact dtypes, example hidden": db.to_dataframe(columns=without_example, compact=True),
+    }
+    for label, frame in frames.items():
+        usage = frame.memory_usage(deep=True)
+        detail = ", ".join(f"{column} {usage[column] / 2**20:.1f}" for column in ("type", "score", "example") if column in usage)
+        print(f"[INFO] {label:<48} {usage.sum() / 2**20:8.1f} MB  ({detail})")
+
+if __name__ == "__main__":
+    main()
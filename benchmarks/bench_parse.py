@@ -0,0 +1,61 @@
+"""Page parsing: NetzParser against the per-field soup extractors Netzverb used before, over the saved
+pages in tests/fixtures/netzverb, with and without the SoupStrainer and with lxml and html.parser.
+The fixtures are trimmed, --filler adds that many KB of unrelated markup to approach a real page.
+python benchmarks/bench_parse.py --filler 150 --repeat 10"""
+import sys
+from argparse import ArgumentParser
+from common import setup, measure, report, pad, FIXTURES, ROOT
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--filler", type=int, default=150, help="KB of extra markup per page, 0 - fixtures as saved")
+    parser.add_argument("--repeat", type=int, default=10, help="parses of every page per timing")
+    args = parser.parse_args()
+
+    setup()
+    sys.path.insert(0, str(ROOT / "tests")) # reference extractors live next to the parser tests
+    from bs4 import BeautifulSoup
+    from services.netz_parser import NetzParser, PARSER
+    from services.settings import SettingsManager
+    from test_netz_parser import legacy_present, legacy_word, legacy_translation, legacy_example, legacy_meaning
+
+    settings = SettingsManager()
+    langs = [settings.get("main_lang")["code"], settings.get("second_lang")["code"]]
+    examples, meanings = settings.get("examples"), settings.get("meanings")
+    pages = [pad(page.read_bytes(), args.filler) for page in sorted(FIXTURES.glob("*.html"))]
+    count = len(pages) * args.repeat
+    print(f"[INFO] {len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.0f} KB on average, {count} parses per timing")
+
+    def legacy(parser: str):
+        # Soup of the whole page, then one search per field
+        def run():
+            for _ in range(args.repeat):
+                for content in pages:
+                    soup = BeautifulSoup(content, parser)
+                    if not legacy_present(soup): continue
+                    legacy_word(soup)
+                    for lang in langs: legacy_translation(soup, lang)
+                    legacy_example(soup, examples)
+                    legacy_meaning(soup, meanings)
+        return run
+
+    def netz_parser(parser: str, strain: bool):
+        def run():
+            NetzParser.parser, NetzParser.strain = parser, strain
+            for _ in range(args.repeat):
+                for content in pages:
+                    record = NetzParser.parse(content)
+                    if not record.present: continue
+                    for lang in langs: record.translation(lang)
+                    record.example(examples)
+                    record.meaning(meanings)
+        return run
+
+    parsers = ["lxml", "html.parser"] if PARSER == "lxml" else ["html.parser"]
+    for parser_name in parsers:
+        report(f"{parser_name}, legacy extractors (before 018)", measure(legacy(parser_name), 3), count, "page")
+        report(f"{parser_name}, NetzParser without strainer", measure(netz_parser(parser_name, False), 3), count, "page")
+        report(f"{parser_name}, NetzParser with strainer", measure(netz_parser(parser_name, True), 3), count, "page")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Translation throughput for every netzverb.parse_workers value from 0 to the CPU count, against the
+local stand-in server serving pages padded to a real page size, for small and large batches.
+python benchmarks/bench_parse_workers.py --sizes 50 400 --filler 150"""
+import os
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from time import perf_counter
+from common import setup, settings, report
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 400], help="words per run")
+    parser.add_argument("--latency", type=float, default=0.05, help="server seconds per request")
+    parser.add_argument("--filler", type=int, default=150, help="KB of extra markup per page")
+    parser.add_argument("--workers", type=int, default=4, help="download threads")
+    parser.add_argument("--max-parse-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    setup()
+    from netz_server import NetzServer
+    from services.netz_client import NetzClient
+    from services.translator import Netzverb, Translator
+
+    server = NetzServer(latency=args.latency, filler=args.filler).start()
+    Netzverb.base_url = Netzverb.noun_url = Netzverb.conj_url = f"{server.url}/?w="
+    translator = Translator()
+    db = translator.importer.db
+    print(f"[INFO] Stand-in server at {server.url}, {args.latency * 1000:.0f} ms per request, "
+          f"{args.filler} KB filler, {os.cpu_count()} CPUs")
+
+    run = 0
+    for size in args.sizes:
+        for parse_workers in range(args.max_parse_workers + 1):
+            options = settings(cache=False, offline=False, rate=10_000, burst=10_000, workers=args.workers,
+                               max_in_flight=args.workers, parse_workers=parse_workers, parse_pool_min_words=0)
+            if parse_workers > 1: # pool start-up is not part of a run, the pool is kept between runs
+                Translator.parse_pool(parse_workers).submit(len, b"").result()
+            db.clear_staged()
+            db.stage_words([("der", f"Wort{run}x{i}", "insert", None) if i % 2 else ("VERB", f"gehen{run}x{i}", "insert", None)
+                            for i in range(size)])
+            db.start_staged_jobs()
+            NetzClient._session = None # fresh pool per run
+            run += 1
+
+            result = {}
+            start = perf_counter()
+            with redirect_stdout(StringIO()): # one line per word
+                translator.get_netz_info(options, callback=lambda success, data: result.update(data))
+            elapsed = perf_counter() - start
+            note = " (same as 0)" if parse_workers == 1 else "" # a single worker process is never started
+            report(f"{size} words, parse_workers={parse_workers}{note}", elapsed, result["success_count"], unit="page")
+    server.shutdown()
+    if Translator._parse_pool is not None: Translator._parse_pool.shutdown()
+
+if __name__ == "__main__":
+    main()
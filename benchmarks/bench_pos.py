@@ -0,0 +1,44 @@
+"""POS tagging of 10k imported words without an article: the old full model load and one nlp()
+call per word against the shared POS-only pipeline and nlp.pipe batches. Needs the spaCy model:
+python -m spacy download de_core_news_sm, then python benchmarks/bench_pos.py --words 10000"""
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from common import setup, german_word, report
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=10_000)
+    args = parser.parse_args()
+
+    setup()
+    from services.nlp import PosTagger
+    try: from spacy import load
+    except ImportError:
+        print("[WARN] spaCy is not installed, nothing to measure")
+        return
+    rng = Random(3)
+    words = [german_word(rng).lower() if i % 3 else german_word(rng) for i in range(args.words)]
+
+    try:
+        start = perf_counter()
+        nlp = load(PosTagger.model, disable=["ner", "parser"]) # loaded on every import before 009
+        loaded = perf_counter() - start
+    except OSError as e:
+        print(f"[WARN] spaCy model {PosTagger.model} is not installed: {e}")
+        return
+    start = perf_counter()
+    before = [nlp(word)[0].pos_ for word in words]
+    report("model load, all pipes (before 009)", loaded)
+    report("one nlp() call per word (before 009)", perf_counter() - start, len(words), "word")
+
+    start = perf_counter()
+    PosTagger.get_nlp()
+    report("model load, POS pipes only", perf_counter() - start)
+    start = perf_counter()
+    after = PosTagger.tag(words)
+    report(f"nlp.pipe, batch_size {PosTagger.batch_size}", perf_counter() - start, len(words), "word")
+    print(f"       same tags for {sum(a == b for a, b in zip(before, after))}/{len(words)} words")
+
+if __name__ == "__main__":
+    main()
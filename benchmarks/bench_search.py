@@ -0,0 +1,34 @@
+"""Table search latency on a 100k-row synthetic vocabulary: FTS5 prefix queries through
+DBManager.search_rowids against a LIKE scan over the same text columns.
+python benchmarks/bench_search.py --rows 100000"""
+from argparse import ArgumentParser
+from common import setup, vocabulary, measure, report
+
+QUERIES = ("bauzeit", "ver", "wald stein", "äu", "e")
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup()
+    from services.DB_manager import DBManager
+    db = DBManager()
+    rows = vocabulary(args.rows)
+    for start in range(0, len(rows), 10_000): db.insert_data(rows[start:start + 10_000])
+
+    like = " OR ".join(f"{column} LIKE :term" for column in DBManager.text_columns)
+    for query in QUERIES:
+        matches = len(db.search_rowids(query))
+        def scan():
+            with db.conn.read() as connection:
+                rowids = None
+                for word in query.split(): # every word has to match somewhere, like search_rowids
+                    found = {row[0] for row in connection.execute(f"SELECT rowid FROM vocabulary WHERE {like};", {"term": f"%{word}%"})}
+                    rowids = found if rowids is None else rowids & found
+        report(f"'{query}' LIKE scan ({matches} FTS matches)", measure(scan, args.repeat))
+        report(f"'{query}' FTS5 prefix query", measure(lambda: db.search_rowids(query), args.repeat))
+
+if __name__ == "__main__":
+    main()
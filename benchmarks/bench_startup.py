@@ -0,0 +1,84 @@
+"""App startup, every run in a fresh interpreter: import time and the heavy modules loaded,
+wall-clock time from the first import to the first rendered view (main() with a stub page up
+to its first page.update()), and an -X importtime report of the slowest imports.
+python benchmarks/bench_startup.py --repeat 5 --top 15"""
+import json
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from common import ROOT, setup, report
+
+BENCHMARKS = ROOT / "benchmarks"
+HEAVY = ("flet", "pandas", "bs4", "requests", "spacy", "services.translator")
+SCENARIOS = {
+    "startup imports": ["main"],
+    "every route at startup (before 010)": ["main", "routes.settings_view", "routes.table_view", "routes.flash_view",
+                                            "routes.translation_view", "services.translator"],
+    "startup + spaCy warm-up (before 010 fix)": ["main", "spacy"],
+}
+IMPORTS = """
+import importlib, json, sys
+from time import perf_counter
+start = perf_counter()
+for module in {modules!r}: importlib.import_module(module)
+print(json.dumps({{"seconds": perf_counter() - start, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+FIRST_VIEW = """
+import json
+from time import perf_counter
+start = perf_counter()
+import main
+imported = perf_counter()
+from common import StubPage
+page = StubPage()
+main.main(page)
+print(json.dumps({"import": imported - start, "first_view": page.first_update - start}))
+"""
+
+def python(code: str, env: dict, *options: str) -> subprocess.CompletedProcess:
+    result = subprocess.run([sys.executable, *options, "-c", code], cwd=ROOT / "src", env=env, capture_output=True, text=True)
+    if result.returncode != 0: raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return result
+
+def last_json(result: subprocess.CompletedProcess) -> dict:
+    return json.loads(result.stdout.strip().splitlines()[-1]) # the app prints its own [INFO] lines before
+
+def importtime(env: dict, top: int):
+    # python -X importtime, slowest modules by cumulative time
+    result = python("import main", env, "-X", "importtime")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line: continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    print(f"[INFO] -X importtime, {top} slowest imports of main (cumulative):")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"       {cumulative / 1000:10.1f} ms  {name}")
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="modules in the -X importtime report")
+    args = parser.parse_args()
+
+    setup()
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join((str(ROOT / "src"), str(BENCHMARKS)))}
+    for label, modules in SCENARIOS.items():
+        try: runs = [last_json(python(IMPORTS.format(modules=modules, heavy=HEAVY), env)) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"[WARN] {label}: {e}")
+            continue
+        report(label, median(run["seconds"] for run in runs))
+        print(f"       loaded: {', '.join(runs[0]['loaded'])}")
+
+    try:
+        runs = [last_json(python(FIRST_VIEW, env)) for _ in range(args.repeat)]
+        report("import main", median(run["import"] for run in runs))
+        report("first rendered view (import + main() to page.update)", median(run["first_view"] for run in runs))
+        importtime(env, args.top)
+    except RuntimeError as e: print(f"[WARN] first view: {e}")
+
+if __name__ == "__main__":
+    main()
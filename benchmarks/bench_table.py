@@ -0,0 +1,48 @@
+"""Table view: ListViewTable(df_manager=...).build_table() and scroll-window rebinds on 1k/10k/100k-row
+frames, against the table before 005 that built a row control for every record (up to --full-max rows).
+python benchmarks/bench_table.py --sizes 1000 10000 100000 --rebinds 200"""
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from common import setup, vocabulary, measure, report
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--rebinds", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--full-max", type=int, default=10_000, help="largest frame built row by row, it takes minutes above")
+    args = parser.parse_args()
+
+    setup()
+    from services.DB_manager import DBManager
+    from services.DF_manager import DFManager
+    from services.settings import SettingsManager
+    from routes.table_view import ListViewTable
+    db = DBManager()
+    rows = vocabulary(max(args.sizes))
+    for start in range(0, len(rows), 10_000): db.insert_data(rows[start:start + 10_000])
+    with redirect_stdout(StringIO()): df_manager = DFManager()
+    settings = SettingsManager()
+    data = df_manager.data
+
+    for size in args.sizes:
+        df_manager.data = data.iloc[:size].copy() # the first size rows stand for a vocabulary of that size
+        table = ListViewTable(df_manager=df_manager, settings=settings)
+        report(f"{size} rows, build_table", measure(table.build_table, args.repeat))
+
+        def scroll():
+            # What on_table_scroll does per jump: move by half a pool and bind the window again
+            table.window_start = 0
+            for _ in range(args.rebinds):
+                table.window_start = max(min(table.window_start + table.pool_size // 2, size - table.pool_size), 0)
+                table._render_window()
+        report(f"{size} rows, scroll-window rebinds", measure(scroll, args.repeat), args.rebinds, "rebind")
+
+        if size > args.full_max: continue
+        full = ListViewTable() # not virtual: one control per record, as before 005
+        full.records = df_manager.data
+        report(f"{size} rows, every row built (before 005)", measure(full.build_table, 1))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Translation throughput against the local stand-in server: the old serial fetch with a
+second per page against the concurrent rate-limited engine.
+python benchmarks/bench_translation.py --words 200 --latency 0.05"""
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from time import perf_counter
+from common import setup, settings, report
+
+def scenarios(args) -> list[tuple[str, int, dict]]:
+    # (label, words, netzverb options)
+    return [
+        ("serial, 1 page/s (before 006)", args.serial_words, {"workers": 1, "rate": 1, "burst": 1, "max_in_flight": 1}),
+        ("shipped settings", args.words, {}),
+        (f"{args.workers} workers unthrottled", args.words,
+         {"rate": 10_000, "burst": 10_000, "max_in_flight": args.workers, "workers": args.workers}),
+    ]
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--serial-words", type=int, default=10, help="the serial run takes a second per word")
+    parser.add_argument("--latency", type=float, default=0.05, help="server seconds per request")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    setup()
+    from netz_server import NetzServer
+    from services.netz_client import NetzClient
+    from services.translator import Netzverb, Translator
+
+    server = NetzServer(latency=args.latency).start()
+    Netzverb.base_url = Netzverb.noun_url = Netzverb.conj_url = f"{server.url}/?w="
+    translator = Translator()
+    db = translator.importer.db
+    print(f"[INFO] Stand-in server at {server.url}, {args.latency * 1000:.0f} ms per request")
+
+    for n, (label, count, options) in enumerate(scenarios(args)):
+        options = settings(cache=False, offline=False, **options)
+        db.clear_staged()
+        db.stage_words([("der", f"Wort{n}x{i}", "insert", None) if i % 2 else ("VERB", f"gehen{n}x{i}", "insert", None)
+                        for i in range(count)])
+        db.start_staged_jobs()
+        NetzClient._session = None # fresh pool per scenario
+        server.reset()
+
+        result = {}
+        start = perf_counter()
+        with redirect_stdout(StringIO()): # one line per word
+            translator.get_netz_info(options, callback=lambda success, data: result.update(data))
+        elapsed = perf_counter() - start
+        report(label, elapsed, result["success_count"], unit="page")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Navigation: 100 route switches across /, /table and /flash through main's route_change on a large
+generated vocabulary, with the ViewCache and with every view rebuilt on each visit as before.
+python benchmarks/bench_views.py --rows 10000 --switches 100"""
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from itertools import cycle, islice
+from time import perf_counter
+from common import setup, vocabulary, report, StubPage
+
+ROUTES = ("/", "/table", "/flash")
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--switches", type=int, default=100)
+    args = parser.parse_args()
+
+    setup()
+    from services.DB_manager import DBManager
+    from services.view_cache import ViewCache
+    db = DBManager()
+    rows = vocabulary(args.rows)
+    for start in range(0, len(rows), 10_000): db.insert_data(rows[start:start + 10_000])
+    import main as app
+
+    class NoCache(ViewCache):
+        # route_change before 012: every visit builds the view again
+        def get(self, route): return None
+        def put(self, route, view): pass
+
+    for label, cache in (("ViewCache", None), ("rebuilt on every visit (before 012)", NoCache())):
+        page = StubPage()
+        with redirect_stdout(StringIO()): # views print while they load
+            app.main(page)
+            if cache is not None: page.view_cache = cache
+            switches = list(islice(cycle(ROUTES[1:] + ROUTES[:1]), args.switches))
+            start = perf_counter()
+            for route in switches: page.go(route)
+            elapsed = perf_counter() - start
+        report(f"{args.switches} switches, {label}", elapsed, args.switches, unit="switch")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from random import Random
+from statistics import median
+from time import perf_counter
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / "tests" / "fixtures" / "netzverb"
+SETTINGS = ROOT / "assets" / "config" / "settings.json"
+
+def setup() -> Path:
+    # Benchmarks run against a throwaway ~/.vocab_app, call before importing services
+    home = Path(tempfile.mkdtemp(prefix="vocab_bench_"))
+    os.environ["HOME"] = str(home)
+    if str(ROOT / "src") not in sys.path: sys.path.insert(0, str(ROOT / "src"))
+    return home
+
+class StubPage:
+    # Enough of ft.Page for main(): routes, views and update() without a Flet client
+    def __init__(self):
+        self.window = SimpleNamespace()
+        self.views = []
+        self.route = "/"
+        self.on_route_change = None
+        self.updates = 0
+        self.first_update = None # perf_counter() of the first page.update(), the first view is on screen
+
+    def go(self, route: str):
+        self.route = route
+        if self.on_route_change: self.on_route_change(SimpleNamespace(route=route, page=self))
+
+    def update(self, *controls):
+        self.updates += 1
+        if self.first_update is None: self.first_update = perf_counter()
+
+def settings(**netzverb) -> dict:
+    # Shipped settings with the "netzverb" section overridden
+    with open(SETTINGS, encoding="utf-8") as f: data = json.load(f)
+    data["netzverb"] = {**data.get("netzverb", {}), **netzverb}
+    return data
+
+def measure(run: callable, repeat: int = 5) -> float:
+    # Median wall time of repeat runs in seconds
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        times.append(perf_counter() - start)
+    return median(times)
+
+def report(label: str, seconds: float, count: int = None, unit: str = "op"):
+    line = f"[INFO] {label:<48} {seconds * 1000:10.2f} ms"
+    if count: line += f"  {seconds / count * 1e6:10.1f} us/{unit}  {count / seconds:10.1f} {unit}/s"
+    print(line)
+
+FILLER_BLOCK = ('<div class="rAbschnitt"><nav><ul>' + '<li><a href="/wort/{n}">Wort {n}</a></li>' * 8 +
+                '</ul></nav><p class="rInf">Fließtext {n} mit <b>Auszeichnung</b> und <i>Kursiv</i>.</p>' +
+                '<script>var x{n} = {n};</script></div>\n')
+
+def pad(content: bytes, kilobytes: int) -> bytes:
+    # Page chrome around the content: navigation, text blocks and scripts the parser has to skip
+    if not kilobytes: return content
+    filler, n = [], 0
+    while sum(map(len, filler)) < kilobytes * 1024:
+        filler.append(FILLER_BLOCK.replace("{n}", str(n)))
+        n += 1
+    text = content.decode("utf-8")
+    head, tail = text.rsplit("</body>", 1) if "</body>" in text else (text, "")
+    return (head + "".join(filler) + "</body>" + tail).encode("utf-8")
+
+SYLLABLES = ("ab", "bau", "ber", "blu", "da", "ein", "fahr", "ge", "haus", "keit", "lich", "men", "nach",
+             "ober", "rat", "schaft", "spiel", "stein", "tag", "ung", "ver", "wald", "zeit", "zug", "äu", "öf", "ün", "ß")
+TYPES = ("der", "die", "das", "VERB", "ADJ", "ADV", "NOUN", "X")
+
+def german_word(rng: Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+
+def sentence(rng: Random, words: int) -> str:
+    return " ".join(german_word(rng).lower() for _ in range(words))
+
+def vocabulary(count: int, seed: int = 7) -> list[dict]:
+    # Synthetic rows with realistic text lengths: short words, a few long meanings and examples
+    rng = Random(seed)
+    return [{
+        "type": rng.choice(TYPES),
+        "german": german_word(rng),
+        "translation": ", ".join(sentence(rng, 1) for _ in range(rng.randint(1, 4))),
+        "second_translation": sentence(rng, 2) if rng.random() < 0.7 else None,
+        "example": sentence(rng, rng.randint(8, 20)) if rng.random() < 0.5 else None,
+        "meaning": sentence(rng, rng.randint(6, 25)) if rng.random() < 0.8 else None,
+        "score": rng.choice((-1, 0, 0, 1, 2, 3)),
+    } for _ in range(count)]
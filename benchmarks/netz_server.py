@@ -0,0 +1,67 @@
+"""Stand-in for Netzverb: serves the saved pages of tests/fixtures/netzverb for any word,
+with a fixed delay per request and optionally padded to the size of a real page.
+python benchmarks/netz_server.py --port 8000 --latency 0.05 --filler 150"""
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+from urllib.parse import urlparse, parse_qs
+from common import FIXTURES, pad
+
+class NetzHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive unless the client asks to close
+    disable_nagle_algorithm = True # headers and body go out as separate writes,
+    wbufsize = 64 * 1024           # buffered they do not wait for a delayed ACK on reused connections
+
+    def do_GET(self):
+        self.server.count("requests")
+        sleep(self.server.latency)
+        word = parse_qs(urlparse(self.path).query).get("w", [""])[0]
+        if word.startswith("missing"): page = self.server.pages["missing"]
+        elif word[:1].isupper(): page = self.server.pages["hund"].replace(b"Hund", word.encode("utf-8"))
+        else: page = self.server.pages["laufen"].replace(b"laufen", word.encode("utf-8"))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, format, *args): pass
+
+class NetzServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.05, filler: int = 0):
+        super().__init__(("127.0.0.1", port), NetzHandler)
+        self.latency = latency
+        self.pages = {page.stem: pad(page.read_bytes(), filler) for page in FIXTURES.glob("*.html")} # filler - KB per page
+        self.stats = {"connections": 0, "requests": 0}
+        self._lock = Lock()
+
+    def count(self, key: str):
+        with self._lock: self.stats[key] += 1
+
+    def process_request(self, request, client_address):
+        self.count("connections")
+        super().process_request(request, client_address)
+
+    def reset(self):
+        with self._lock: self.stats = {"connections": 0, "requests": 0}
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "NetzServer":
+        Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--filler", type=int, default=0, help="KB of extra markup per page")
+    args = parser.parse_args()
+    server = NetzServer(args.port, args.latency, args.filler)
+    print(f"[INFO] Serving {sorted(server.pages)} at {server.url}/?w=<word>")
+    server.serve_forever()
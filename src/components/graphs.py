@@ -63,4 +63,45 @@ class StatsPieChart(ft.PieChart):
                 radius=self.normal_style["radius"],
                 data={"count_val":elem["count"], "stat_name":elem["name"]}
             ) for i, elem in enumerate(self.display_data)
-        ]
\ No newline at end of file
+        ]
+
+class StatsBarChart(ft.BarChart):
+    # Stacked bar per entry, display_data items are {"name": label, "values": {series: count}}
+    def __init__(self, display_data: list[dict], main_color: str = None, caption: ft.Ref[ft.Text] = None):
+        super().__init__(groups_space=4, width=260, height=150, interactive=True)
+        self.display_data = display_data
+        self.max_total = max([sum(item["values"].values()) for item in self.display_data] + [1])
+
+        # Colors setup, first series gets the lightest shade
+        self.main_color = main_color if main_color != None else "INDIGO"
+        self.colors = [getattr(ft.Colors, f"{self.main_color}_{shade}") for shade in [300,500,700,900]]
+
+        self.max_y = self.max_total
+        self.left_axis = ft.ChartAxis(labels_size=30, labels_interval=max(self.max_total // 2, 1))
+        self.bottom_axis = ft.ChartAxis(labels_size=20, labels=[
+            ft.ChartAxisLabel(value=i, label=ft.Text(item["name"][-2:], size=10, color="white"))
+            for i, item in enumerate(self.display_data) if (len(self.display_data) - 1 - i) % 2 == 0 # every other day, ending today
+        ])
+
+        # Fill with data
+        self.caption_text = caption.current
+        self.on_chart_event = self.chart_event
+        self.fill_groups()
+
+    def chart_event(self, e: ft.BarChartEvent):
+        if e.group_index is None or e.group_index < 0: return
+        item = self.display_data[e.group_index]
+        counts = ", ".join(f"{name} {count}" for name, count in item["values"].items())
+        self.caption_text.value = f"{item['name']}: {counts}"
+        self.caption_text.update()
+
+    def fill_groups(self):
+        self.bar_groups = []
+        for i, item in enumerate(self.display_data):
+            stack, top = [], 0
+            for color, count in zip(self.colors, item["values"].values()):
+                stack.append(ft.BarChartRodStackItem(from_y=top, to_y=top + count, color=color))
+                top += count
+            self.bar_groups.append(ft.BarChartGroup(x=i, bar_rods=[
+                ft.BarChartRod(from_y=0, to_y=top, width=10, border_radius=2, rod_stack_items=stack, show_tooltip=False) # details go to the caption
+            ]))
@@ -1,10 +1,26 @@
 import flet as ft
 from routes.home_view import HomeView
-from routes.settings_view import SettingsView
-from routes.table_view import TableView
-from routes.flash_view import FlashCardView
-from routes.translation_view import TranslationView
 from services.DF_manager import DFManager
+from services.settings import SettingsManager
+from services.nlp import PosTagger
+from services.view_cache import ViewCache
+from threading import Thread
+from multiprocessing import freeze_support
+
+def resume_translations(page: ft.Page):
+    # Jobs of a run started in the last session are finished in the background,
+    # words that were only staged wait for Translate
+    db = page.df_manager.db
+    db.reset_in_flight_jobs()
+    if not db.count_jobs().get("pending"): return
+
+    def run():
+        from services.translator import Translator # pulls in bs4/requests
+        def on_complete(success: bool, data: dict):
+            if data["rowids"]: page.df_manager.add_rows(data["rowids"])
+            print(f"[INFO] Resumed translations: {data['success_count']}/{data['words_count']}")
+        Translator().get_netz_info(SettingsManager().data, callback=on_complete)
+    Thread(target=run, daemon=True).start()
 
 def main(page: ft.Page):
     page.title = "Vocabulary Booster V2"
@@ -18,6 +34,12 @@ def main(page: ft.Page):
     # page.show_semantics_debugger = True
     page.home_view = HomeView(page.df_manager)
 
+    # Keep built views between visits, drop them when their data or settings change
+    page.view_cache = ViewCache()
+    page.view_cache.put("/", page.home_view.fetch_view())
+    page.df_manager.subscribe(lambda: page.view_cache.on_data_changed(page.route))
+    SettingsManager.subscribe(lambda keys: page.view_cache.on_settings_saved(keys, page.route))
+
     page.fonts = {
         "Inter":"/fonts/Inter-Regular.ttf",
         "Inter-Bold":"/fonts/Inter-Bold.ttf",
@@ -38,21 +60,36 @@ def main(page: ft.Page):
             ),
         )
     
+    def build_view(route: str) -> ft.View | None:
+        # Routes other than home are imported on first visit to keep startup light
+        if route == "/":
+            page.home_view = HomeView(page.df_manager)
+            return page.home_view.fetch_view()
+        elif route == "/settings":
+            from routes.settings_view import SettingsView
+            return SettingsView().fetch_view()
+        elif route == "/table":
+            from routes.table_view import TableView
+            return TableView(page.df_manager).fetch_view()
+        elif route == "/flash":
+            from routes.flash_view import FlashCardView
+            return FlashCardView(page.df_manager).fetch_view()
+        elif route == "/translation":
+            from routes.translation_view import TranslationView # pulls in bs4/requests
+            if SettingsManager().get("nlp", {}).get("warm_up"): PosTagger.warm_up() # spaCy is only needed from here on
+            return TranslationView(page.df_manager).fetch_view()
+        return None
+
     def route_change(e: ft.RouteChangeEvent):
         if page.route_history[-1] != page.route:
             page.route_history.append(page.route)
         page.views.clear()
 
-        if page.route == "/":
-            page.views.append(HomeView(page.df_manager).fetch_view())
-        elif page.route == "/settings":
-            page.views.append(SettingsView().fetch_view())
-        elif page.route == "/table":
-            page.views.append(TableView(page.df_manager).fetch_view())
-        elif page.route == "/flash":
-            page.views.append(FlashCardView(page.df_manager).fetch_view())
-        elif page.route == "/translation":
-            page.views.append(TranslationView(page.df_manager).fetch_view())
+        view = page.view_cache.get(page.route)
+        if view is None:
+            view = build_view(page.route)
+            page.view_cache.put(page.route, view)
+        if view is not None: page.views.append(view)
         page.update()
         # print(page.route_history)
 
@@ -68,7 +105,8 @@ def main(page: ft.Page):
                 previous_route = page.route_history[-1]
                 page.go(previous_route)
         elif e.key == "Backspace" and page.route == "/table" and not page.dialog_is_open:
-            page.views[-1].controls[0].content.controls[2].delete_selected()
+            table_view = page.views[-1].controls[0].content
+            if not table_view.search_focused: table_view.table.delete_selected() # Backspace while typing a search
         elif e.key in ("Space", " ") and page.route == "/flash":
             page.views[-1].controls[0].flip_card()
     
@@ -77,4 +115,10 @@ def main(page: ft.Page):
     page.on_view_pop = view_pop
     page.go(page.route)
 
-ft.app(target=main, assets_dir="assets")
+    resume_translations(page)
+
+    PosTagger.configure(SettingsManager().get("nlp", {}))
+
+if __name__ == "__main__": # worker processes of the parse pool import this module too
+    freeze_support() # parse pool workers in a frozen build
+    ft.app(target=main, assets_dir="assets")
@@ -1,8 +1,10 @@
 import flet as ft 
 from services.settings import SettingsManager
 from services.DF_manager import DFManager
+from services.scheduler import Scheduler
 from components.appbar import AppBar
 from pandas import DataFrame, Series
+from time import time, monotonic
 
 
 class FlashCardView(ft.Column):
@@ -14,6 +16,7 @@ class FlashCardView(ft.Column):
         self.deck_len = 1
         self.current_card_index = 0
         self.current_row = Series()
+        self.shown_at = monotonic() # when the current card was shown, for answer latency
 
         self.settings = SettingsManager()
         self.df_manager = df_manager
@@ -195,15 +198,13 @@ class FlashCardView(ft.Column):
         )
 
     def start_game(self, e: ft.ControlEvent):
-        self.deck = self.df_manager.fetch_df(mode=self.deck_choice.value)
+        # Cards due for review, most overdue first
+        self.deck = self.df_manager.fetch_due(self.deck_choice.value, int(self.settings.get("cards_in_deck", default=20)))
         if self.deck.shape[0] == 0:
             self.change_view(e, 4)
             return
 
-        sample_amount = lambda shape: min(int(self.settings.get("cards_in_deck", default=20)), shape)
-        self.deck = self.deck.sample(sample_amount(self.deck.shape[0]), weights=self.deck.score.apply(lambda x: 4-x))
         self.deck_len = self.deck.shape[0]
-        self.deck.reset_index(inplace=True)
 
         self.current_card_index = 0
 
@@ -241,8 +242,6 @@ class FlashCardView(ft.Column):
             self.back_view.visible = False
             self.btn_row.disabled = True
             self.btn_row.opacity = 0.0
-        if new_view_index == 3:
-            self.save_scores()
 
         current = views[self.side_index]
         current.visible = False
@@ -255,7 +254,10 @@ class FlashCardView(ft.Column):
 
     def next_card(self, e: ft.ControlEvent, new_score: int = None):
         if new_score != None and self.current_card_index > 0:
-            self.deck.at[self.current_card_index - 1, "score"] = new_score
+            card = self.deck.iloc[self.current_card_index - 1]
+            schedule = Scheduler.review(card, new_score, time())
+            # Saved right away, a session closed halfway keeps its answers
+            self.df_manager.review(card["rowid"], int(card["score"]), schedule, latency=round(monotonic() - self.shown_at, 2))
             print(f"set new score ({new_score}) for {self.deck.at[self.current_card_index - 1, "german"]}")
 
         self.current_card_index += 1
@@ -283,7 +285,4 @@ class FlashCardView(ft.Column):
         self.card.update()
         e.page.update()    
         self.back_view.content.visible = True    
-
-    def save_scores(self):
-        scores = self.deck[["rowid", "score"]]
-        self.df_manager.update_scores(scores)
\ No newline at end of file
+        self.shown_at = monotonic()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import flet as ft
 from components.appbar import AppBar
 from components.buttons import RefreshButton
-from components.graphs import StatsPieChart
+from components.graphs import StatsPieChart, StatsBarChart
 from services.home_helpers import DayWord, Statistics
 from services.DF_manager import DFManager
 
@@ -90,7 +90,10 @@ class HomeView(ft.Column):
         def on_refresh(e: ft.ControlEvent):
             # self.refresh_btn.disabled = True
             # self.refresh_btn.update()
-            self.day_word.get_word_data() # get new word
+            if not self.day_word.get_word_data(): # pool is empty, keep current word
+                self.refresh_btn.disabled = False
+                self.refresh_btn.update()
+                return
             self.word_card_refs["german"].current.value = get_display_word()
             self.word_card_refs["translation"].current.value =  self.day_word.word_data["translation"]
             self.word_card_refs["add_btn"].current.selected = False
@@ -141,6 +144,7 @@ class HomeView(ft.Column):
         # Create refs
         size_ref = ft.Ref[ft.Text]()
         chart_row_ref = ft.Ref[ft.Row]()
+        history_row_ref = ft.Ref[ft.Row]()
         info_row_ref = ft.Ref[ft.Row]()
 
         self.stats_card = ft.Container(
@@ -169,6 +173,13 @@ class HomeView(ft.Column):
                     ref=chart_row_ref,
                     visible=not no_data_flag
                     ),
+                    ft.Row(
+                        self.create_history_charts(),
+                        alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                        spacing=10,
+                        ref=history_row_ref,
+                        visible=not no_data_flag
+                    ),
                     ft.Row(
                         [ft.Text("Vocabulary is empty", size=16)], 
                         alignment="center", 
@@ -176,7 +187,7 @@ class HomeView(ft.Column):
                         visible=no_data_flag)
                 ]),
                 padding=20,
-                data={"size_ref":size_ref, "chart_row": chart_row_ref, "info_row": info_row_ref},
+                data={"size_ref":size_ref, "chart_row": chart_row_ref, "history_row": history_row_ref, "info_row": info_row_ref},
                 **self.container_style
             )
         
@@ -195,6 +206,40 @@ class HomeView(ft.Column):
             padding=10
         )
         
+    def create_bar_chart(self, label, mode, color = None):
+        text_ref = ft.Ref[ft.Text]()
+        caption_text = ft.Text("", size=14, color="white", ref=text_ref)
+        chart = StatsBarChart(self.statistics.get_stats(mode), color, text_ref)
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(label, size=14, color="white", weight="bold"),
+                chart,
+                caption_text
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+            padding=10
+        )
+
+    def create_history_charts(self) -> list[ft.Control]:
+        # Daily rollups of the last Statistics.history_days days
+        days = self.statistics.history_days
+        return [
+            self.create_bar_chart(f"Reviews, {days} days", "reviews", "DEEP_PURPLE"),
+            self.create_bar_chart("Vocabulary Size", "vocabulary"),
+            ft.Container(
+                content=ft.Column([
+                    ft.Text(f"Last {days} days", size=14, color="white", weight="bold"),
+                    ft.Text(f"Reviews - {self.statistics.period_reviews}"),
+                    ft.Text(f"Accuracy - {self.statistics.period_accuracy}%"),
+                    ft.Text(f"Words learned - {self.statistics.period_learned}"),
+                ],
+                alignment=ft.MainAxisAlignment.CENTER,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                padding=10
+            )
+        ]
+
     def create_integrity_flag(self):
         text_ref = ft.Ref[ft.Text]()
         self.integrity_caption = ft.Text("", size=14, color="white", ref=text_ref)
@@ -242,6 +287,9 @@ class HomeView(ft.Column):
         self.stats_card.data["chart_row"].current.controls[1] = self.create_chart("Vocabulary Progress", "score", "DEEP_PURPLE")
         self.stats_card.data["chart_row"].current.visible = True
         self.stats_card.data["chart_row"].current.update()
+        self.stats_card.data["history_row"].current.controls = self.create_history_charts()
+        self.stats_card.data["history_row"].current.visible = True
+        self.stats_card.data["history_row"].current.update()
 
         # Remove info row
         if self.stats_card.data["info_row"].current.visible:
@@ -166,6 +166,7 @@ class SettingsView(ft.Column):
                 key=e.control.label.value,
                 value=e.control.value
             )
+            self.settings.save() # debounced, Escape leaves without on_exit
 
         controls = []
         
@@ -201,6 +202,7 @@ class SettingsView(ft.Column):
         def selected(e: ft.ControlEvent):
             lang_text.value = e.control.data["lang"]
             self.settings.set(lang_var, e.control.data)
+            self.settings.save()
             self.update()
 
         lang_text = ft.Text(value=self.settings.get(lang_var)["lang"], text_align=ft.TextAlign.END)
@@ -227,6 +229,7 @@ class SettingsView(ft.Column):
         def on_change(e: ft.ControlEvent):
             selected = options[e.control.selected_index]
             self.settings.set(key=mode, value=selected)
+            self.settings.save()
 
         match mode:
             case "cards_in_deck": 
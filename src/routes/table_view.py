@@ -4,9 +4,12 @@ from services.edit_dialog import EditDialog
 from services.DF_manager import DFManager
 from components.appbar import AppBar
 from components.buttons import StateButton
-from pandas import DataFrame
+from pandas import DataFrame, isna
+from time import monotonic
+from threading import Timer
 
 class TableView(ft.Column):
+    search_delay = 0.3 # seconds
     def __init__(self, df_manager: DFManager):
         super().__init__(spacing=12, expand=True, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
 
@@ -25,6 +28,7 @@ class TableView(ft.Column):
 
         self.controls = [
             self.btn_row, 
+            self.search_field,
             self.filter_row,
             self.table
         ]
@@ -85,6 +89,17 @@ class TableView(ft.Column):
             icon=ft.Icons.FILTER_ALT_ROUNDED,
             expand=True
         )
+        self.search_field = ft.TextField(
+            hint_text="Search words, translations, meanings and examples",
+            prefix_icon=ft.Icons.SEARCH_ROUNDED,
+            on_change=self.on_search_changed,
+            on_focus=lambda e: setattr(self, "search_focused", True),
+            on_blur=lambda e: setattr(self, "search_focused", False),
+            border_color=ft.Colors.GREY,
+            dense=True
+        )
+        self.search_timer: Timer | None = None
+        self.search_focused = False
         self.btn_row = ft.Row(
             controls=[
                 self.delete_btn,
@@ -96,6 +111,20 @@ class TableView(ft.Column):
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN
         )        
 
+    def on_search_changed(self, e: ft.ControlEvent):
+        # Debounced: search runs once typing pauses for search_delay seconds
+        if self.search_timer is not None: self.search_timer.cancel()
+        self.search_timer = Timer(self.search_delay, self.run_search, args=(e.control.value,))
+        self.search_timer.daemon = True
+        self.search_timer.start()
+
+    def run_search(self, text: str):
+        self.table.search_text = text
+        self.table.filter_selected()
+        if self.filter_row.visible:
+            self.rows_count_txt.value = f"rows: {self.table.records.shape[0]}"
+            self.rows_count_txt.update()
+
     def create_filter_controls(self):
         self.filter_dropdown = ft.Dropdown(
             options=[
@@ -116,13 +145,11 @@ class TableView(ft.Column):
 
     def on_filter_changed(self, e: ft.ControlEvent = None):
         def chip_selected(e: ft.ControlEvent):
-            if not self.table.selected_filters:
-                self.table.selected_filters = (e.control.data["column"], [])
-            
+            values = self.table.selected_filters.setdefault(e.control.data["column"], [])
             if e.control.selected:
-                self.table.selected_filters[1].append(e.control.data["value"])
-            else: 
-                self.table.selected_filters[1].remove(e.control.data["value"])
+                values.append(e.control.data["value"])
+            elif e.control.data["value"] in values:
+                values.remove(e.control.data["value"])
             
             self.table.filter_selected()
             self.rows_count_txt.value = f"rows: {self.table.records.shape[0]}"
@@ -131,7 +158,8 @@ class TableView(ft.Column):
         selected = e.control.value if e is not None else self.filter_dropdown.value
 
         self.filter_row.controls = [self.filter_dropdown]
-        self.table.selected_filters = ()
+        # Chips of other categories stay applied, categories are combined with AND
+        is_selected = lambda column, value: value in self.table.selected_filters.get(column, [])
 
         match selected:
             case "Type":
@@ -140,6 +168,7 @@ class TableView(ft.Column):
                         ft.Chip(
                             label=ft.Text(chip),
                             on_select=chip_selected,
+                            selected=is_selected("TYPE", chip.lower()),
                             data={"column": "TYPE", "value": chip.lower()}
                         )
                     )
@@ -149,6 +178,7 @@ class TableView(ft.Column):
                         ft.Chip(
                             label=ft.Text(chip),
                             on_select=chip_selected,
+                            selected=is_selected("type", chip),
                             data={"column": "type", "value": chip}
                         )
                     )
@@ -158,6 +188,7 @@ class TableView(ft.Column):
                         ft.Chip(
                             label=ft.Text(chip),
                             on_select=chip_selected,
+                            selected=is_selected("score", chip),
                             data={"column": "score", "value": chip}
                         )
                     )
@@ -167,6 +198,7 @@ class TableView(ft.Column):
                         ft.Chip(
                             label=ft.Text(chip),
                             on_select=chip_selected,
+                            selected=is_selected("special", chip.lower()),
                             data={"column": "special", "value": chip.lower()}
                         )
                     )
@@ -180,7 +212,7 @@ class TableView(ft.Column):
         self.on_filter_changed()
         self.filter_row.visible = not self.filter_row.visible
                 
-        self.table.selected_filters = ()
+        self.table.selected_filters = {}
         self.table.filter_selected()
 
         self.update()
@@ -210,16 +242,32 @@ class ListViewTable(ft.ListView):
         super().__init__(spacing=5, auto_scroll=False, expand=True)
         self.df_manager = df_manager
         self.records = df_manager.data if self.df_manager != None else records
-        self.selected_refs: list[ft.Ref] = []
-        self.selected_filters: tuple[str, str|list] = ()
+        self.selected_rows: list[int] = [] # rowids, rows may be scrolled out of the window
+        self.selected_filters: dict[str, list] = {} # column: values, see FilterEngine
+        self.search_text = ""
         self.on_selection_changed = on_selection_changed
         self.settings = settings
         self.last_sort = {}
         self.sort_old_first = False
+        self.sorted_rowids: list[int] | None = None # display order of a column sort, None - records order
+        self._sort_pages = None                     # rest of the sorted order, fetched while scrolling
+
+        # Virtualized mode - only a window of rows is materialized, row controls are reused
+        self.virtual = self.df_manager != None
+        self.pool_size = 60       # rows rendered at once
+        self.row_height = 64
+        self.window_start = 0     # position of the first rendered row in self.records
+        self.row_pool: list[ft.Container] = []
+        self._last_shift = 0.0
+        if self.virtual:
+            self.on_scroll = self.on_table_scroll
+            self.on_scroll_interval = 50
+
         if isinstance(self.records, DataFrame): self.build_table()
 
     def build_table(self):
         self.controls.clear()
+        self.row_pool = [] # columns could change, rebuild row controls
         self.last_sort = {"col": None, "asc": False}
         self.header_vals = []
         self.header_ref = ft.Ref[ft.Container]()
@@ -230,20 +278,72 @@ class ListViewTable(ft.ListView):
                 if value: self.header_vals.append(col)
         else: 
             self.header_vals = list(self.records.columns)
+        if self.df_manager != None: # long texts are loaded only when shown
+            self.df_manager.load_columns(self.header_vals) # adds them to the frame in place
 
         self.controls.append(self._build_row(self.header_vals, is_header=True, ref=self.header_ref))
         self._build_content()
     
     def _build_content(self, sorted = False):
-        self.controls = [self.controls[0]] # Delete all rows except header
-        if not sorted: self.records.sort_index(inplace=True, ascending=self.sort_old_first)
-
-        for row in self.records.itertuples():
+        if not sorted:
+            self.records.sort_index(inplace=True, ascending=self.sort_old_first)
+            self.sorted_rowids, self._sort_pages = None, None
+        self.window_start = 0
+        self._render_window()
+
+    def _render_window(self):
+        # Bind rows [window_start, window_start + pool_size) to pooled containers
+        header = self.controls[0]
+        window_size = self.pool_size if self.virtual else self.records.shape[0]
+        if self.sorted_rowids is not None:
+            self._fetch_sorted(self.window_start + window_size)
+            rows = self.records.loc[self.sorted_rowids[self.window_start:self.window_start + window_size]]
+        else: rows = self.records.iloc[self.window_start:self.window_start + window_size]
+
+        while len(self.row_pool) < rows.shape[0]: # grows up to pool_size at most
             ref = ft.Ref[ft.Container]()
-            container = self._build_row(row, ref=ref)
-            self.controls.append(container)
+            self.row_pool.append(self._build_row(None, ref=ref))
+
+        for container, row in zip(self.row_pool, rows.itertuples()):
+            self._bind_row(container, row)
+        self.controls = [header, *self.row_pool[:rows.shape[0]]]
+
+    def _bind_row(self, container: ft.Container, row: tuple):
+        container.data["rowid"] = row.Index
+        container.bgcolor = ft.Colors.INDIGO_500 if row.Index in self.selected_rows else ft.Colors.GREY_700
+        for text in container.content.controls:
+            value = getattr(row, text.data["col"])
+            text.value = None if isna(value) else value # NULL can come back as NaN after dtype casts
+
+    def _fetch_sorted(self, count: int):
+        # Pull sorted pages until count rowids are known or the order is complete
+        while self._sort_pages is not None and len(self.sorted_rowids) < count:
+            page = next(self._sort_pages, None)
+            if page is None: self._sort_pages = None
+            else: self.sorted_rowids.extend(page)
+
+    def on_table_scroll(self, e: ft.OnScrollEvent):
+        # Move the window by half a pool when the viewport gets close to its edges
+        if monotonic() - self._last_shift < 0.15: return # ignore events sent before the last jump
+        total = self.records.shape[0]
+        extent = self.row_height + self.spacing
+        threshold = extent * 5
+        shift = self.pool_size // 2
+
+        if e.pixels >= e.max_scroll_extent - threshold and self.window_start + self.pool_size < total:
+            new_start = min(self.window_start + shift, total - self.pool_size)
+        elif e.pixels <= threshold and self.window_start > 0:
+            new_start = max(self.window_start - shift, 0)
+        else: return
+
+        moved = new_start - self.window_start
+        self.window_start = new_start
+        self._last_shift = monotonic()
+        self._render_window()
+        self.update()
+        self.scroll_to(offset=max(e.pixels - moved * extent, 0))
 
-    def _build_row(self, data: tuple | list[str], ref=None, is_header = False):  
+    def _build_row(self, data: tuple | list[str] | None, ref=None, is_header = False):  
         default_bgcolor = ft.Colors.with_opacity(0.45, ft.Colors.GREY_800) if is_header else ft.Colors.GREY_700
         text_style = {
             "size":14,
@@ -279,7 +379,7 @@ class ListViewTable(ft.ListView):
         else:
             controls_list = [
                 ft.Text(
-                    value=getattr(data, col_name),
+                    value=getattr(data, col_name) if data is not None else None,
                     expand=self.column_flexes_dict.get(col_name, 2),
                     data={"col":col_name},
                     **text_style
@@ -299,30 +399,37 @@ class ListViewTable(ft.ListView):
             bgcolor=default_bgcolor,
             ink=True,
             animate=ft.Animation(200, "easeInOut"),
+            height=self.row_height if self.virtual and not is_header else None, # fixed extent to keep scroll offsets exact
             ref=ref,
-            data={"ref": ref,"rowid": data.Index} if not is_header else {"ref": ref},
+            data={"ref": ref,"rowid": data.Index if data is not None else None} if not is_header else {"ref": ref},
         )
         if not is_header and self.df_manager != None:
             row.on_click = self.on_container_click
             row.on_long_press = self.on_container_long_press
         return row
 
+    def _container_for(self, rowid: int) -> ft.Container:
+        # Pooled container if the row is rendered, otherwise a detached one for dialogs
+        for container in self.controls[1:]:
+            if container.data["rowid"] == rowid: return container
+        row = next(self.records.loc[[rowid]].itertuples())
+        return self._build_row(row, ref=ft.Ref[ft.Container]())
+
     def on_container_click(self, e: ft.ControlEvent):
         container = e.control
-        ref = container.data["ref"]
-        if not ref:
+        rowid = container.data["rowid"]
+        if rowid is None:
             return
 
-        if ref in self.selected_refs:
-            self.selected_refs.remove(ref)
+        if rowid in self.selected_rows:
+            self.selected_rows.remove(rowid)
             container.bgcolor = ft.Colors.GREY_700
         else:
-            self.selected_refs.append(ref)
+            self.selected_rows.append(rowid)
             container.bgcolor = ft.Colors.INDIGO_500
 
         container.update()
-        # print(f"{len(self.selected_refs)=}")
-        if self.on_selection_changed: self.on_selection_changed(len(self.selected_refs))
+        if self.on_selection_changed: self.on_selection_changed(len(self.selected_rows))
 
     def on_container_long_press(self, e: ft.ControlEvent):
         container = e.control
@@ -330,38 +437,42 @@ class ListViewTable(ft.ListView):
         dialog.open_dialog(e)
 
     def delete_selected(self):
-        if len(self.selected_refs) == 0:
-            return # No selected refs
-        rowids = []
-        for ref in self.selected_refs:
-            if ref.current and ref.current in self.controls:
-                self.controls.remove(ref.current)
-                rowids.append(ref.current.data["rowid"])
-        self.selected_refs.clear()
-        self.update()
+        if len(self.selected_rows) == 0:
+            return # No selected rows
+        rowids = list(self.selected_rows)
+        self.selected_rows.clear()
         if self.on_selection_changed: self.on_selection_changed(0)
-        self.df_manager.delete_rows(rowids)
+        self.df_manager.delete_rows(rowids) # drops rows from df_manager.data in place
+        if self.records is not self.df_manager.data: # filtered records are a separate frame
+            self.records = self.records.drop(rowids, errors="ignore")
+        if self.sorted_rowids is not None:
+            deleted = set(rowids)
+            self.sorted_rowids = [rowid for rowid in self.sorted_rowids if rowid not in deleted]
+        self.window_start = max(min(self.window_start, self.records.shape[0] - self.pool_size), 0)
+        self._render_window()
+        self.update()
 
     def call_dialog(self, e, mode: str = "edit"):
         # mode = [edit, new]
         if mode == "new": 
             dialog = EditDialog(None, self.save_new_record) # Call New dialog
         else:
-            dialog = EditDialog(self.selected_refs[0].current, self.save_updated_record) # Call Edit dialog
+            dialog = EditDialog(self._container_for(self.selected_rows[0]), self.save_updated_record) # Call Edit dialog
         
         dialog.open_dialog(e)
 
     def save_updated_record(self, edited_container_ref: ft.Ref[ft.Container]):
-        ref = edited_container_ref
-        if ref in self.selected_refs:
-            self.selected_refs.remove(ref)
-            ref.current.bgcolor = ft.Colors.GREY_700
-            ref.current.update()
-            if self.on_selection_changed: self.on_selection_changed(len(self.selected_refs))
+        container = edited_container_ref.current
+        rowid = container.data["rowid"]
+        if rowid in self.selected_rows:
+            self.selected_rows.remove(rowid)
+            container.bgcolor = ft.Colors.GREY_700
+            if self.on_selection_changed: self.on_selection_changed(len(self.selected_rows))
         
-        container = ref.current
-        container.update()
+        if container in self.controls: container.update()
         self.df_manager.update_record(container)
+        if self.records is not self.df_manager.data: # filtered records are a separate frame, re-take the rows with the edit
+            self.records = self.df_manager.data.loc[self.records.index]
     
     def save_new_record(self, new_row: dict):
         self.df_manager.create_new_record(new_row)
@@ -385,16 +496,17 @@ class ListViewTable(ft.ListView):
         
         if col_name == "index":
             self.records.sort_index(inplace=True, ascending=self.last_sort["asc"])
-        elif col_name == "score":
-            self.records.sort_values(by=col_name, inplace=True, ascending=self.last_sort["asc"])
-        else:
-            self.records.sort_values(by=col_name, inplace=True, ascending=self.last_sort["asc"], key=lambda col: col.str.lower())
+            self.sorted_rowids, self._sort_pages = None, None
+        else: # German order, pages are pulled by _render_window as the window moves
+            self.sorted_rowids = []
+            self._sort_pages = self.df_manager.sorted_pages(col_name, self.last_sort["asc"], self.records)
         
         if self.on_selection_changed: self.on_selection_changed(0)
-        self.selected_refs.clear()
+        self.selected_rows.clear()
         self.highlight_col(col_name)
         self._build_content(sorted=True)
         self.update()
+        self.scroll_to(offset=0)
 
     def sort_index(self, e: ft.ControlEvent = None):
         self.sort_old_first = not self.sort_old_first
@@ -417,11 +529,10 @@ class ListViewTable(ft.ListView):
         self.header_ref.current.update()
 
     def filter_selected(self):
-        if not self.selected_filters or not len(self.selected_filters[1]):
-            self.records = self.df_manager.data
-        else:
-            self.records = self.df_manager.fetch_df("filter", self.selected_filters)
+        self.records = self.df_manager.filter(self.selected_filters)
+        if self.search_text.strip(): self.records = self.df_manager.search(self.search_text, self.records)
         
         self.highlight_col("none", True)
         self._build_content()
-        self.update()
\ No newline at end of file
+        self.update()
+        self.scroll_to(offset=0)
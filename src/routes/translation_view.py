@@ -4,9 +4,7 @@ from services.settings import SettingsManager
 from services.DF_manager import DFManager
 from services.translator import Translator
 from routes.table_view import ListViewTable
-from pandas import DataFrame, Series
 from threading import Thread
-from re import split
 
 class TranslationView(ft.Column):
     def __init__(self, df_manager: DFManager):
@@ -18,13 +16,16 @@ class TranslationView(ft.Column):
 
         self.table = ListViewTable(records=self.translator.data)
         self.progress_bar = ft.ProgressBar(visible=False)
+        self.queue_text = ft.Text(size=12, color=ft.Colors.GREY_400)
         self.create_input_row()
+        self.show_queue() # words staged in a previous session
         # self.create_filepicker()
 
         self.controls = [
             self.input_row,
             self.progress_bar,
             self.bulk_input_field,
+            self.queue_text,
             self.table
         ]
 
@@ -96,6 +97,15 @@ class TranslationView(ft.Column):
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER
             )
             self.dialog.content.height = 34 * len(self.dialog.content.controls) - 10
+
+        if data.get("known_count"): # words found in the vocabulary, no request was sent for them
+            self.dialog.content = ft.Column([
+                self.dialog.content,
+                ft.Row([ft.Text(f"Already in vocabulary: {data['known_count']}", size=16)], alignment=ft.MainAxisAlignment.CENTER)
+                ],
+                tight=True,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER
+            )
         
         if self not in self.page.overlay:
             self.page.overlay.clear()
@@ -203,35 +213,35 @@ class TranslationView(ft.Column):
         self.page.update()
 
     def add_to_input(self, e: ft.ControlEvent):
-        input_data = []
-        if not self.bulk_input_field.visible: input_data.append(self.input_field.value)
-        else: # Bulk input scenario
-            raw_input = self.bulk_input_field.value
-            # Split by multiple separators: comma, semicolon, newline, tab, space
-            words = split(r"[,\n;\t]+", raw_input)
-            # Clean up whitespace and remove empty strings
-            input_data = [w.strip() for w in words if w.strip()]
-            print("Parsed words:", input_data)
+        # Single word or pasted list, both go through the streaming importer
+        text = self.bulk_input_field.value if self.bulk_input_field.visible else self.input_field.value
 
-        self.translator.input_data = Series(input_data)
-        self.translator.clean_data()
-        
         # Clear input field
         self.input_field.value = ""
         self.bulk_input_field.value = ""
         self.action_btn.disabled = True
+        self.progress_bar.visible = True
+        self.progress_bar.value = 0.0
         self.update()
-        
+
+        Thread(target=self.run_import, args=(text,), daemon=True).start()
+
+    def run_import(self, text: str):
+        policy = self.settings.get("netzverb.duplicates", "skip") # skip | refresh | insert
+        stats = self.translator.add_text(text, progress_callback=self.progress_callback, policy=policy)
+        if stats["existing"]: print(f"[INFO] Skipped {stats['existing']} words already in vocabulary")
+        self.progress_bar.visible = False
+
         # Enable translate button
-        if self.translator.data.shape[0] > 0: 
-            self.translate_btn.disabled = False
-            self.translate_btn.update()
+        self.show_queue()
 
         self.table.records = self.translator.data
         self.table.build_table()
-        self.table.update()
+        self.update()
 
     def translate(self, e: ft.ControlEvent):
+        self.df_manager.db.requeue_failed_jobs() # Translate retries words that failed before
+        self.df_manager.db.start_staged_jobs()
         self.progress_bar.visible = True
         self.progress_bar.value = 0.0
         self.progress_bar.update()
@@ -247,6 +257,16 @@ class TranslationView(ft.Column):
             daemon=True
         ).start()
 
+    def show_queue(self):
+        # Counts cover the whole queue, the table only its first Translator.preview_rows words
+        counts = self.translator.counts
+        parts = [f"{count} {status.replace('_', ' ')}" for status, count in counts.items()]
+        shown = self.translator.data.shape[0]
+        if shown < self.translator.staged_count: parts.append(f"showing {shown}")
+        self.queue_text.value = ", ".join(parts)
+        self.queue_text.visible = bool(counts)
+        self.translate_btn.disabled = self.translator.staged_count == 0
+
     def progress_callback(self, current: int, all_vals: int):
         progress_value = current / all_vals
         self.progress_bar.value = progress_value
@@ -256,19 +276,20 @@ class TranslationView(ft.Column):
         self.progress_bar.visible = False
         self.progress_bar.update()
         # call dialogs
-        success_flag = False if data["success_count"] == 0 else success
+        nothing_to_fetch = data["known_count"] and not data["failed_words"] # every word was known
+        success_flag = False if data["success_count"] == 0 and not nothing_to_fetch else success
         self.open_dialog(success_flag, data)
 
-        if success_flag: 
-            # update table
-            self.table.records = self.translator.data
-            self.table.build_table()
-            self.table.update()
-            # Add new data to db
-            self.df_manager.add_translated_data(self.translator.data)
-            # Clear translator dataframe for new words
-            self.translator.data = DataFrame()
-        else:
-            self.translator.data = self.translator.data[["type", "german"]]
-            self.translate_btn.disabled = False
-            self.translate_btn.update()
\ No newline at end of file
+        # Words are already in the DB, only the DataFrame has to catch up
+        if data["rowids"]: self.df_manager.add_rows(data["rowids"])
+        self.translator.reload()
+
+        # Show translated words, or what is left in the queue when nothing went through
+        # Read from the database, the frame may leave long texts out
+        if success_flag:
+            rowids = data["rowids"][:Translator.preview_rows] # the table is not virtual, keep the preview short
+            self.table.records = self.df_manager.db.fetch_rows(rowids, columns=list(self.df_manager.db.display_columns))
+        else: self.table.records = self.translator.data
+        self.table.build_table()
+        self.show_queue()
+        self.update()
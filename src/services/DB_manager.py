@@ -1,9 +1,24 @@
 import sqlite3
-from pandas import DataFrame, read_sql_query
-from re import search, IGNORECASE
+from pandas import DataFrame, read_sql_query, concat
+from re import search, findall, IGNORECASE
 from pathlib import Path
+from typing import Iterator
+from services.db_connection import ConnectionManager
+from services.migrations import migrate, UMLAUT_FOLDS
+from services.scheduler import Scheduler
+from services.collation import COLLATION
 
 class DBManager:
+    type_groups = {
+        "nouns": ("NOUN", "PROPN", "der", "die", "das"),
+        "verbs": ("VERB", "AUX"),
+        "adjectives": ("ADJ", "ADP", "ADV"),
+    } # everything else is "other"
+    sort_columns = ("german", "translation", "type") # have COLLATE GERMAN indexes
+    text_columns = ("german", "translation", "second_translation", "example", "meaning")
+    long_columns = ("example", "meaning") # loaded into DataFrames only when shown, see DFManager.frame_columns
+    display_columns = ("type", "german", "translation", "second_translation", "example", "meaning", "score") # schedule columns stay internal
+
     def __init__(self):
         # self.path = Path(__file__).parent.parent / "db/vocabulary.db"
         self.path = self.get_db_path()
@@ -17,33 +32,21 @@ class DBManager:
 
     def connect_to_db(self):
         try:
-            self.connection = sqlite3.connect(self.path)
-            self.cursor = self.connection.cursor()
-            print(f"[INFO] Connected to database at {self.path}")
+            self.conn = ConnectionManager.get(self.path)
             self.create_table()
         except sqlite3.Error as e:
             print(f"[ERROR] Failed to connect to database: {e}")
             raise 
 
     def create_table(self):
-        with sqlite3.connect(self.path) as connection:
-            cursor = connection.cursor()
+        # Creates the table on first run and upgrades older databases in place
+        with self.conn.write() as connection:
+            migrate(connection)
 
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS vocabulary (
-                type TEXT NOT NULL,
-                german TEXT NOT NULL,
-                translation TEXT,
-                second_translation TEXT,
-                example TEXT,
-                meaning TEXT,
-                score INTEGER NOT NULL DEFAULT 0
-            ); """)
-
-            connection.commit()
-
-    def insert_data(self, data: dict | list | DataFrame): # ensure to always form dictionaries 
-        with sqlite3.connect(self.path) as connection:
+    def insert_data(self, data: dict | list | DataFrame) -> list[int]: # ensure to always form dictionaries 
+        # Returns rowids of inserted rows so callers can patch their caches
+        rowids = []
+        with self.conn.write() as connection:
             cursor = connection.cursor()
 
             if isinstance(data, DataFrame): 
@@ -58,18 +61,18 @@ class DBManager:
             """
 
             try:
-                if isinstance(data, list):
-                    cursor.executemany(insert_query, data)
-                else:
-                    cursor.execute(insert_query, data)
-                connection.commit()
+                for row in (data if isinstance(data, list) else [data]): # one transaction, lastrowid per row
+                    cursor.execute(insert_query, row)
+                    rowids.append(cursor.lastrowid)
             except sqlite3.IntegrityError as e:
                 print("IntegrityError:", e)
             except Exception as e:
                 print("Error:", e)
+        return rowids
 
-    def update_data(self, data: dict | list | DataFrame): # to bulk update, all columns should be same
-        with sqlite3.connect(self.path) as connection:
+    def update_data(self, data: dict | list | DataFrame) -> list[int]: # to bulk update, all columns should be same
+        rowids = []
+        with self.conn.write() as connection:
             cursor = connection.cursor()
 
             if isinstance(data, DataFrame):
@@ -88,16 +91,18 @@ class DBManager:
             try:
                 if isinstance(data, list):
                     cursor.executemany(update_query, data)
+                    rowids = [row["rowid"] for row in data]
                 else:
                     cursor.execute(update_query, data)
-                connection.commit()
+                    rowids = [data["rowid"]]
             except sqlite3.IntegrityError as e:
                 print("IntegrityError:", e)
             except Exception as e:
                 print("Error:", e)
-            
+        return rowids
+
     def delete_data(self, data: dict | list | DataFrame):
-        with sqlite3.connect(self.path) as connection:
+        with self.conn.write() as connection:
             cursor = connection.cursor()
 
             delete_query = """
@@ -114,50 +119,71 @@ class DBManager:
                     cursor.executemany(delete_query, data_list)
                 else:
                     cursor.execute(delete_query, data)
-                connection.commit()
             except sqlite3.IntegrityError as e:
                 print("IntegrityError:", e)
             except Exception as e:
                 print("Error:", e)
 
     def drop_table(self):
-        with sqlite3.connect(self.path) as connection:
+        with self.conn.write() as connection:
             cursor = connection.cursor()
 
             cursor.execute("DROP TABLE IF EXISTS vocabulary;")
-
-            connection.commit()
         
     def fetch_data(self, mode: str = "all", just_return_query: bool = False) -> list | str:
-        with sqlite3.connect(self.path) as connection:
-            cursor = connection.cursor()
-            select_query = "SELECT rowid, * FROM vocabulary "
+        select_query = "SELECT rowid, * FROM vocabulary "
+
+        match mode:
+            case "duplicates": select_query += """                                    
+                                WHERE (type, german) IN (
+                                    SELECT type, german FROM vocabulary
+                                    GROUP BY type, german
+                                    HAVING COUNT(*) > 1
+                                ); """
+            case "nulls"     : select_query += """
+                                WHERE translation IS NULL;
+                                """
+            case "new"       : select_query += "WHERE score = 0;"
+            case "repeat"    : select_query += "WHERE score IN (-1, 1);"
+            case "learnt"    : select_query += "WHERE score IN (2, 3);"
+            case "nouns"     : select_query += "WHERE rowid IN (SELECT rowid FROM vocabulary WHERE type IN ('NOUN', 'PROPN', 'der', 'die', 'das'));" # covering index, not a table scan
+            case "verbs"     : select_query += "WHERE type IN ('VERB', 'AUX');"
+            case "adjectives": select_query += "WHERE type IN ('ADJ', 'ADP', 'ADV');"
+            case "other"     : select_query += "WHERE type NOT IN ('NOUN', 'VERB', 'ADJ', 'PROPN', 'AUX', 'ADP', 'ADV', 'der', 'die', 'das');"
+            case _           : select_query += ";" # all
+
+        if just_return_query:
+            return select_query
+        with self.conn.read() as connection:
+            return connection.execute(select_query).fetchall()
+        
+    def fetch_due(self, mode: str, limit: int, now: float) -> DataFrame:
+        # Next cards of a flashcard deck, most overdue first; one ORDER BY due LIMIT over the due indexes
+        match mode:
+            case "new"   : where, params = "score = 0", []
+            case "repeat": where, params = "score != 0 AND due <= ?", [now]
+            case "other" :
+                all_types = [t for types in self.type_groups.values() for t in types]
+                where = f"type NOT IN ({', '.join('?' * len(all_types))}) AND due <= ?"
+                params = [*all_types, now]
+            case _:
+                types = self.type_groups.get(mode, ())
+                where = f"type IN ({', '.join('?' * len(types))}) AND due <= ?"
+                params = [*types, now]
+        query = f"SELECT rowid, * FROM vocabulary WHERE {where} ORDER BY due LIMIT ?;"
+        with self.conn.read() as connection:
+            return read_sql_query(query, connection, params=[*params, int(limit)])
+
+    def log_reviews(self, reviews: list[dict]):
+        # Appends answers to review_log and stores the new schedules, one transaction per batch
+        with self.conn.write() as connection:
+            connection.executemany("""
+                INSERT INTO review_log (word_rowid, reviewed_at, old_score, new_score, latency, interval, ease)
+                VALUES (:rowid, :reviewed_at, :old_score, :score, :latency, :interval, :ease);""", reviews)
+            connection.executemany(f"""
+                UPDATE vocabulary SET {", ".join(f"{col}=:{col}" for col in Scheduler.columns)}
+                WHERE rowid=:rowid;""", reviews)
 
-            match mode:
-                case "duplicates": select_query += """                                    
-                                    WHERE (type, german) IN (
-                                        SELECT type, german FROM vocabulary
-                                        GROUP BY type, german
-                                        HAVING COUNT(*) > 1
-                                    ); """
-                case "nulls"     : select_query += """
-                                    WHERE translation IS NULL;
-                                    """
-                case "new"       : select_query += "WHERE score = 0;"
-                case "repeat"    : select_query += "WHERE score IN (-1, 1);"
-                case "learnt"    : select_query += "WHERE score IN (2, 3);"
-                case "nouns"     : select_query += "WHERE type IN ('NOUN', 'PROPN', 'der', 'die', 'das');"
-                case "verbs"     : select_query += "WHERE type IN ('VERB', 'AUX');"
-                case "adjectives": select_query += "WHERE type IN ('ADJ', 'ADP', 'ADV');"
-                case "other"     : select_query += "WHERE type NOT IN ('NOUN', 'VERB', 'ADJ', 'PROPN', 'AUX', 'ADP', 'ADV', 'der', 'die', 'das');"
-                case _           : select_query += ";" # all
-
-            if just_return_query:
-                return select_query
-            else:
-                cursor.execute(select_query)
-                return cursor.fetchall()
-            
     def count_rows(self, mode: str = "all") -> int:
         select_query = self.fetch_data(mode, just_return_query=True)
 
@@ -167,19 +193,288 @@ class DBManager:
             count_query = 'SELECT COUNT(*) ' + select_query[from_index:]
         else: count_query = "SELECT COUNT(*) FROM vocabulary;"
 
-        with sqlite3.connect(self.path) as connection:
+        with self.conn.read() as connection:
             cursor = connection.cursor()
             cursor.execute(count_query)
             return cursor.fetchone()[0]
 
-    def to_dataframe(self, mode: str = "all", filters: tuple[str, list] = None) -> DataFrame:
+    def fetch_stats(self) -> dict[str, int]:
+        # All home screen counters from one scan: rows are grouped by (type, german) once,
+        # so duplicates come out of the same pass as score/type buckets and nulls
+        group_sums = []
+        all_types = []
+        for group, types in self.type_groups.items():
+            values = ", ".join(f"'{t}'" for t in types)
+            group_sums.append(f"COALESCE(SUM(CASE WHEN type IN ({values}) THEN n END), 0) AS {group}")
+            all_types.append(values)
+        group_sums.append(f"COALESCE(SUM(CASE WHEN type NOT IN ({', '.join(all_types)}) THEN n END), 0) AS other")
+
+        stats_query = f"""
+        WITH grouped AS (
+            SELECT type, COUNT(*) AS n,
+                SUM(translation IS NULL) AS nulls,
+                SUM(score = 0) AS new,
+                SUM(score IN (-1, 1)) AS repeat,
+                SUM(score IN (2, 3)) AS learnt
+            FROM vocabulary
+            GROUP BY type, german
+        )
+        SELECT
+            COALESCE(SUM(n), 0) AS all_words,
+            COALESCE(SUM(CASE WHEN n > 1 THEN n END), 0) AS duplicates,
+            COALESCE(SUM(nulls), 0) AS nulls,
+            COALESCE(SUM(new), 0) AS new,
+            COALESCE(SUM(repeat), 0) AS repeat,
+            COALESCE(SUM(learnt), 0) AS learnt,
+            {", ".join(group_sums)}
+        FROM grouped;
+        """
+        with self.conn.read() as connection:
+            cursor = connection.execute(stats_query)
+            names = [col[0] for col in cursor.description]
+            return dict(zip(names, cursor.fetchone()))
+
+    def fetch_daily_stats(self, start: str, end: str) -> DataFrame:
+        # daily_stats rows of the days start..end (YYYY-MM-DD) plus the last earlier row, whose
+        # running totals hold for the days before the first active one. Inactive days have no row.
+        query = """
+        SELECT * FROM daily_stats
+        WHERE day >= COALESCE((SELECT MAX(day) FROM daily_stats WHERE day < :start), :start) AND day <= :end
+        ORDER BY day;"""
+        with self.conn.read() as connection:
+            return read_sql_query(query, connection, params={"start": start, "end": end}, index_col="day")
+
+    def fetch_period_stats(self, start: str, end: str) -> dict[str, int]:
+        # Totals of the days start..end from two rows of running totals, independent of the range length.
+        # Type counts are the vocabulary size at the end of the range.
+        query = f"""
+        WITH last AS (SELECT * FROM daily_stats WHERE day <= :end ORDER BY day DESC LIMIT 1),
+             before AS (SELECT * FROM daily_stats WHERE day < :start ORDER BY day DESC LIMIT 1)
+        SELECT
+            {", ".join(f"last.total_{col} - COALESCE(before.total_{col}, 0) AS {col}" for col in ("reviews", "correct", "learned"))},
+            {", ".join(f"last.{col} AS {col}" for col in (*self.type_groups, "other"))}
+        FROM last LEFT JOIN before;"""
+        with self.conn.read() as connection:
+            cursor = connection.execute(query, {"start": start, "end": end})
+            names = [col[0] for col in cursor.description]
+            row = cursor.fetchone()
+            return dict(zip(names, row if row else [0] * len(names)))
+
+    def iter_sorted_rowids(self, column: str, ascending: bool = True, page_size: int = 500) -> Iterator[list[int]]:
+        # Rowids in German order, one page per next(). Keyset pagination: every page continues
+        # after the (value, rowid) of the previous page's last row with range seeks on the column's
+        # COLLATE GERMAN index instead of sorting the table. NULLs come first ascending, last descending.
+        if column not in self.sort_columns: raise ValueError(f"No sort index for {column}")
+        direction, compare = ("ASC", ">") if ascending else ("DESC", "<")
+        value = f"{column} COLLATE {COLLATION}"
+
+        def page(where: str, order: str, params: list, limit: int) -> list[tuple]:
+            with self.conn.read() as connection:
+                return connection.execute(
+                    f"SELECT {column}, rowid FROM vocabulary WHERE {where} ORDER BY {order} LIMIT ?;", [*params, limit]).fetchall()
+
+        def values():
+            rows = page(f"{column} IS NOT NULL", f"{value} {direction}, rowid {direction}", [], page_size)
+            while rows:
+                yield [row[1] for row in rows]
+                last_value, last_rowid = rows[-1]
+                # rest of the last value's rows, then the following values; two seeks, as
+                # "(value, rowid) > (?, ?)" would scan the index from its start
+                rows = page(f"{value} = ? AND rowid {compare} ?", f"rowid {direction}", [last_value, last_rowid], page_size)
+                if len(rows) < page_size:
+                    rows += page(f"{value} {compare} ?", f"{value} {direction}, rowid {direction}", [last_value], page_size - len(rows))
+
+        def nulls():
+            rows = page(f"{column} IS NULL", f"rowid {direction}", [], page_size)
+            while rows:
+                yield [row[1] for row in rows]
+                rows = page(f"{column} IS NULL AND rowid {compare} ?", f"rowid {direction}", [rows[-1][1]], page_size)
+
+        phases = (nulls, values) if ascending else (values, nulls)
+        for phase in phases:
+            yield from phase()
+
+    def fetch_rows(self, rowids: list[int], chunk_size: int = 500, columns: list[str] = None) -> DataFrame:
+        # Read only the given rows, used to patch DataFrames after writes
+        frames = []
+        with self.conn.read() as connection:
+            for start in range(0, len(rowids), chunk_size):
+                chunk = [int(n) for n in rowids[start:start + chunk_size]]
+                query = f"SELECT {self.select_list(columns)} FROM vocabulary WHERE rowid IN ({', '.join('?' * len(chunk))});"
+                frames.append(read_sql_query(query, connection, index_col="rowid", params=chunk))
+        if not frames: return DataFrame()
+        return concat(frames) if len(frames) > 1 else frames[0]
+
+    def search_rowids(self, text: str, limit: int = None) -> list[int]:
+        # Every word of the query must match as a prefix of a word in any text column
+        for letter, replacement in UMLAUT_FOLDS:
+            text = text.replace(letter, replacement)
+        terms = findall(r"\w+", text)
+        if not terms: return []
+        match_query = " ".join(f'"{term}"*' for term in terms)
+        query = "SELECT rowid FROM vocabulary_fts WHERE vocabulary_fts MATCH ?"
+        params = [match_query]
+        if limit: # ranking only pays off when results are cut
+            query += " ORDER BY rank LIMIT ?"
+            params.append(int(limit))
+        with self.conn.read() as connection:
+            return [row[0] for row in connection.execute(query + ";", params)]
+
+    @classmethod
+    def word_key(cls, word_type: str | None, german: str) -> tuple[str, str]:
+        # Normalized duplicate key: "der Hund", "NOUN hund" and "die  HUND" are the same noun
+        group = next((group for group, types in cls.type_groups.items() if word_type in types), "other")
+        return group, " ".join(str(german).split()).casefold()
+
+    def find_existing(self, pairs: list[tuple[str, str]], chunk_size: int = 300) -> dict[tuple[str, str], int]:
+        # rowid of a vocabulary row for every (type, german) pair already stored, keyed by word_key.
+        # The NOCASE index narrows the lookup, word_key settles umlauts and type groups.
+        variants = set()
+        for _, german in pairs:
+            variants.update((german, german.lower(), german[:1].upper() + german[1:])) # NOCASE only folds ASCII
+        variants = list(variants)
+        wanted = {self.word_key(word_type, german) for word_type, german in pairs}
+        found = {}
+        with self.conn.read() as connection:
+            for start in range(0, len(variants), chunk_size):
+                chunk = variants[start:start + chunk_size]
+                query = f"SELECT rowid, type, german FROM vocabulary WHERE german COLLATE NOCASE IN ({', '.join('?' * len(chunk))});"
+                for rowid, word_type, german in connection.execute(query, chunk):
+                    key = self.word_key(word_type, german)
+                    if key in wanted: found.setdefault(key, rowid)
+        return found
+
+    def stage_words(self, rows: list[tuple]) -> int:
+        # rows of (type, german, policy, target_rowid), words staged already are skipped; returns the number of new rows
+        if not rows: return 0
+        with self.conn.write() as connection:
+            cursor = connection.executemany("""INSERT OR IGNORE INTO import_staging (type, german, policy, target_rowid, status)
+                                            VALUES (?, ?, ?, ?, 'staged');""", rows)
+            return cursor.rowcount
+
+    def start_staged_jobs(self) -> int:
+        # Translate was pressed: staged words become jobs, resumed on restart from now on
+        with self.conn.write() as connection:
+            return connection.execute("UPDATE import_staging SET status = 'pending', next_attempt = 0 WHERE status = 'staged';").rowcount
+
+    def fetch_staged(self, limit: int = None) -> DataFrame:
+        # Words not translated yet, failed ones first. limit - the first rows only, None - all
+        query = """SELECT id, type, german, status, attempts, last_error FROM import_staging
+                   WHERE status != 'done' ORDER BY status = 'failed' DESC, id LIMIT ?;"""
+        with self.conn.read() as connection:
+            return read_sql_query(query, connection, index_col="id", params=(-1 if limit is None else limit,))
+
+    def claim_jobs(self, limit: int, now: float) -> list[dict]:
+        # Marks due pending jobs as in flight and returns them with the attempt counted
+        with self.conn.write() as connection:
+            cursor = connection.execute("""
+                SELECT id, type, german, attempts + 1, target_rowid FROM import_staging
+                WHERE status = 'pending' AND next_attempt <= ? ORDER BY id LIMIT ?;""", (now, limit))
+            jobs = [dict(zip(("id", "type", "german", "attempts", "target_rowid"), row)) for row in cursor.fetchall()]
+            connection.executemany("UPDATE import_staging SET status = 'in_flight', attempts = ? WHERE id = ?;",
+                                   [(job["attempts"], job["id"]) for job in jobs])
+        return jobs
+
+    def finish_job(self, job_id: int, record: dict, target_rowid: int = None) -> int:
+        # Vocabulary row and job status are written in one transaction.
+        # With target_rowid (refresh policy) only the fetched texts of that row are replaced.
+        with self.conn.write() as connection:
+            if target_rowid is not None:
+                refreshed = {key: value for key, value in record.items() if key not in ("type", "german", "score")}
+                rowids = self.update_data({**refreshed, "rowid": target_rowid})
+            else: rowids = self.insert_data(record)
+            if not rowids: raise sqlite3.IntegrityError(f"Failed to store {record.get('german')}")
+            connection.execute("UPDATE import_staging SET status = 'done', last_error = NULL WHERE id = ?;", (job_id,))
+        return rowids[0]
+
+    def fail_job(self, job_id: int, error: str, retry_at: float = None):
+        # With retry_at the job goes back to pending until that time, otherwise it is failed for good
+        with self.conn.write() as connection:
+            if retry_at is None:
+                connection.execute("UPDATE import_staging SET status = 'failed', last_error = ? WHERE id = ?;", (error, job_id))
+            else:
+                connection.execute("UPDATE import_staging SET status = 'pending', last_error = ?, next_attempt = ? WHERE id = ?;",
+                                   (error, retry_at, job_id))
+
+    def resolve_known_jobs(self, chunk_size: int = 500) -> int:
+        # Checks pending jobs against the vocabulary before anything is fetched:
+        # "skip" jobs of known words are dropped, "refresh" jobs get the row to update.
+        # Returns the number of fetches avoided.
+        with self.conn.read() as connection:
+            jobs = connection.execute("""SELECT id, type, german, policy FROM import_staging
+                                      WHERE status = 'pending' AND policy != 'insert' AND target_rowid IS NULL;""").fetchall()
+        skipped = []
+        targets = []
+        for start in range(0, len(jobs), chunk_size):
+            chunk = jobs[start:start + chunk_size]
+            existing = self.find_existing([(word_type, german) for _, word_type, german, _ in chunk])
+            for job_id, word_type, german, policy in chunk:
+                rowid = existing.get(self.word_key(word_type, german))
+                if rowid is None: continue
+                if policy == "skip": skipped.append((job_id,))
+                else: targets.append((rowid, job_id))
+        if skipped or targets:
+            with self.conn.write() as connection:
+                connection.executemany("DELETE FROM import_staging WHERE id = ?;", skipped)
+                connection.executemany("UPDATE import_staging SET target_rowid = ? WHERE id = ?;", targets)
+        return len(skipped)
+
+    def drop_job(self, job_id: int):
+        with self.conn.write() as connection:
+            connection.execute("DELETE FROM import_staging WHERE id = ?;", (job_id,))
+
+    def reset_in_flight_jobs(self) -> int:
+        # Jobs left in flight by a crash or a closed app, only call when no worker runs
+        with self.conn.write() as connection:
+            return connection.execute("UPDATE import_staging SET status = 'pending' WHERE status = 'in_flight';").rowcount
+
+    def requeue_failed_jobs(self) -> int:
+        with self.conn.write() as connection:
+            return connection.execute("""UPDATE import_staging SET status = 'pending', attempts = 0, next_attempt = 0
+                                      WHERE status = 'failed';""").rowcount
+
+    def next_job_time(self) -> float | None:
+        with self.conn.read() as connection:
+            return connection.execute("SELECT MIN(next_attempt) FROM import_staging WHERE status = 'pending';").fetchone()[0]
+
+    def count_jobs(self) -> dict[str, int]:
+        with self.conn.read() as connection:
+            return dict(connection.execute("SELECT status, COUNT(*) FROM import_staging GROUP BY status;").fetchall())
+
+    def clear_done_jobs(self):
+        with self.conn.write() as connection:
+            connection.execute("DELETE FROM import_staging WHERE status = 'done';")
+
+    def clear_staged(self):
+        with self.conn.write() as connection:
+            connection.execute("DELETE FROM import_staging;")
+
+    def to_dataframe(self, mode: str = "all", filters: tuple[str, list] = None, columns: list[str] = None, compact: bool = False) -> DataFrame:
+        # columns - projection (default: all), compact - memory-optimized dtypes, see compact_dtypes
         if mode == "filter" and filters is not None:
             query = self.create_filter_query(filters)
         else: 
             query = self.fetch_data(mode, just_return_query=True) # get query according to given mode
-        with sqlite3.connect(self.path) as connection:
+        if columns is not None: query = query.replace("SELECT rowid, *", f"SELECT {self.select_list(columns)}", 1)
+        with self.conn.read() as connection:
             # read the data into DataFrame and make rowid the index
-            return read_sql_query(query, connection, index_col="rowid") 
+            df = read_sql_query(query, connection, index_col="rowid")
+        return self.compact_dtypes(df) if compact else df
+
+    def table_columns(self) -> list[str]:
+        with self.conn.read() as connection:
+            return [row[1] for row in connection.execute("PRAGMA table_info(vocabulary);")]
+
+    @staticmethod
+    def select_list(columns: list[str] = None) -> str:
+        return "rowid, *" if columns is None else ", ".join(["rowid", *columns])
+
+    @classmethod
+    def compact_dtypes(cls, df: DataFrame) -> DataFrame:
+        # type as category (a handful of values), score as int8, texts stay object
+        if "type" in df.columns: df["type"] = df["type"].astype("category")
+        if "score" in df.columns: df["score"] = df["score"].astype("int8")
+        return df
         
     def update_from_df(self, df: DataFrame):
         if "rowid" not in df.columns: # if rowid is not in the df, add it from index
@@ -187,13 +482,12 @@ class DBManager:
 
         self.update_data(df)
 
-        with sqlite3.connect(self.path) as connection:
+        with self.conn.write() as connection:
             cursor = connection.cursor()
             query = """
             DELETE FROM vocabulary WHERE german LIKE '#del%';
             """
             cursor.execute(query)
-            connection.commit()
 
     def create_filter_query(self, filter_tuple: tuple[str, list]):
         select_query = "SELECT rowid, * FROM vocabulary "
@@ -204,20 +498,18 @@ class DBManager:
 
         if filter_tuple[0] in ("TYPE"):
             values = ""
-            other_type = ""
+            selects = []
             for mode in filter_tuple[1]:
                 match mode:
                     case "noun"     : values += "'NOUN', 'PROPN', 'der', 'die', 'das',"
                     case "verb"     : values += "'VERB', 'AUX'," 
                     case "adjective": values += "'ADJ', 'ADP', 'ADV',"
-                    case "other"    : other_type += "WHERE type NOT IN ('NOUN', 'VERB', 'ADJ', 'PROPN', 'AUX', 'ADP', 'ADV', 'der', 'die', 'das')"
+                    case "other"    : selects.append("""SELECT rowid FROM vocabulary
+                                        WHERE type NOT IN ('NOUN', 'VERB', 'ADJ', 'PROPN', 'AUX', 'ADP', 'ADV', 'der', 'die', 'das')""")
                     case _          : pass # all            
-            if other_type:
-                select_query += other_type
-                if values: # if len(values) > 0
-                    select_query += f" OR type IN ({values[:-1]});" 
-                else:  select_query += ';'
-            elif values: select_query += f"WHERE type IN ({values[:-1]});"
+            if values: selects.insert(0, f"SELECT rowid FROM vocabulary WHERE type IN ({values[:-1]})")
+            # rowids from the covering type indexes, the planner would scan the table for broad type filters
+            if selects: select_query += f"WHERE rowid IN ({' UNION ALL '.join(selects)});"
             else: select_query += ';'
 
         if filter_tuple[0] in ("special"):
@@ -1,21 +1,78 @@
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, CategoricalDtype, concat
+from pandas.testing import assert_frame_equal
+from numpy import flatnonzero, arange
+from time import time
+from typing import Iterator
 from services.DB_manager import DBManager
+from services.filter_engine import FilterEngine
+from services.review_log import ReviewWriter
+from services.collation import german_key
+from services.settings import SettingsManager
 from flet import Container
 
 class DFManager():
-    def __init__(self, fill = True):
+    compact = True # memory-optimized dtypes for self.data, see DBManager.compact_dtypes
+
+    def __init__(self, fill = True, verify = False):
         print("DFManager called")
         self.data = DataFrame()
         self.db = DBManager()
+        self.version = 0 # bumped on every change of self.data
+        self.verify = verify # compare patched frame with a fresh load after each write
+        self._listeners: list[callable] = []
+        self.filter_engine = FilterEngine(self)
+        self._reviews: ReviewWriter | None = None # started on the first flashcard answer
+        self._sort_ranks: dict[str, Series] = {} # column -> sort positions, valid for _sort_ranks_version
+        self._sort_ranks_version = None
         if fill: self.fill_data()
 
+    def subscribe(self, callback: callable):
+        # callback() is called after every change of self.data
+        self._listeners.append(callback)
+
+    def _notify(self):
+        for callback in self._listeners:
+            callback()
+
     def fill_data(self):
-        self.data = self.db.to_dataframe()
+        self.data = self.db.to_dataframe(columns=self.frame_columns(), compact=self.compact)
+        self.version += 1
+        self._notify()
+
+    def frame_columns(self) -> list[str] | None:
+        # Long texts stay in the database unless the table shows them, flashcard decks read their own rows.
+        # None - all columns
+        shown = SettingsManager().get("columns", {})
+        hidden = [column for column in DBManager.long_columns if not shown.get(column, True)]
+        if not hidden: return None
+        return [column for column in self.db.table_columns() if column not in hidden]
+
+    def load_columns(self, columns: list[str]):
+        # Adds columns left out by frame_columns, e.g. after they were switched on in settings
+        missing = [column for column in columns if column not in self.data.columns]
+        if not missing: return
+        loaded = self.db.to_dataframe(columns=missing, compact=self.compact)
+        for column in missing:
+            self.data[column] = loaded[column] # aligned on rowid, the frame object is kept
+
+    def _conform(self, rows: DataFrame) -> DataFrame:
+        # Rows fetched or edited elsewhere in the frame's columns and dtypes, new categories are added to the frame
+        rows = rows[[column for column in rows.columns if column in self.data.columns]].copy()
+        for column in rows.columns:
+            dtype = self.data[column].dtype
+            if isinstance(dtype, CategoricalDtype):
+                new = [value for value in rows[column].dropna().unique() if value not in dtype.categories]
+                if new:
+                    self.data[column] = self.data[column].cat.add_categories(new)
+                    dtype = self.data[column].dtype
+            if rows[column].dtype != dtype: rows[column] = rows[column].astype(dtype)
+        return rows
 
     def delete_rows(self, rowids: list[int]):
         self.data.drop(rowids, inplace=True)
         rows_to_delete = [{"rowid": n} for n in rowids]
         self.db.delete_data(data=rows_to_delete)
+        self._patched()
 
     def print_info(self, df: DataFrame = None):
         if not isinstance(df, DataFrame): df = self.data
@@ -35,32 +92,136 @@ class DFManager():
         if row_index in self.data.index:
             valid_keys = [k for k in new_row if k in self.data.columns]
             if valid_keys:
-                self.data.loc[row_index, valid_keys] = Series(new_row) # update DataFrame
+                values = self._conform(DataFrame([{key: new_row[key] for key in valid_keys}], index=[row_index]))
+                self.data.loc[[row_index], valid_keys] = values # update DataFrame
                 new_row["rowid"] = row_index
                 self.db.update_data(new_row) # update DB with rowid
+                self._patched()
             else:
                 print("[WARN] No valid columns to update.")
         else:
             print(f"[ERROR] Index {row_index} not found in DataFrame.")
 
-    def update_scores(self, df: DataFrame):
-        self.db.update_data(data=df) # Update scores for selected rowids
-        self.fill_data() # Than refresh DF
+    def review(self, rowid: int, old_score: int, schedule: dict, latency: float = None):
+        # Answered flashcard: the frame row is patched now, the DB row and review_log
+        # entry are written by the background ReviewWriter
+        if self._reviews is None: self._reviews = ReviewWriter(self.db)
+        self._reviews.record({"rowid": int(rowid), "reviewed_at": time(), "old_score": old_score, "latency": latency, **schedule})
+        if rowid in self.data.index:
+            columns = [col for col in schedule if col in self.data.columns]
+            self.data.loc[rowid, columns] = [schedule[col] for col in columns]
+        self.version += 1
+        self._notify()
+
+    def flush_reviews(self):
+        if self._reviews is not None: self._reviews.flush()
 
     def create_new_record(self, new_row: dict):
         if new_row == None: return
         for key in new_row.keys():
             if new_row[key] in ("", "-"):
                 new_row[key] = None
-        self.db.insert_data(new_row) # Insert row first in DB
-        self.fill_data() # Than refresh DF
+        rowids = self.db.insert_data(new_row) # Insert row first in DB
+        self._append_rows(rowids) # Than add it to DF
 
     def add_translated_data(self, new_data: DataFrame):
-        self.db.insert_data(new_data)
-        self.fill_data() # Refresh DF
+        rowids = self.db.insert_data(new_data)
+        self._append_rows(rowids)
+
+    def add_rows(self, rowids: list[int]):
+        # Rows already written to the DB by someone else, e.g. translation workers.
+        # Rows the frame has already (refreshed translations) are updated in place.
+        known = [rowid for rowid in rowids if rowid in self.data.index]
+        if known: self._update_rows(self.db.fetch_rows(known, columns=list(self.data.columns)))
+        self._append_rows([rowid for rowid in rowids if rowid not in self.data.index])
+
+    def _append_rows(self, rowids: list[int]):
+        if not rowids: return
+        if self.data.empty:
+            self.data = self.db.fetch_rows(rowids, columns=self.frame_columns())
+            if self.compact: self.data = DBManager.compact_dtypes(self.data)
+        else:
+            new_rows = self._conform(self.db.fetch_rows(rowids, columns=list(self.data.columns)))
+            self.data = concat([self.data, new_rows])
+        self._patched()
+
+    def _update_rows(self, updates: DataFrame):
+        updates = self._conform(updates)
+        columns = list(updates.columns)
+        rowids = updates.index.intersection(self.data.index)
+        if columns and len(rowids):
+            self.data.loc[rowids, columns] = updates.loc[rowids, columns]
+        self._patched()
+
+    def _patched(self):
+        self.version += 1
+        if self.verify: self.check_consistency()
+        self._notify()
+
+    def check_consistency(self) -> bool:
+        # Patched frame must match a fresh load, up to row order and dtypes
+        normalize = lambda df: df.sort_index().astype(object).where(df.notna(), None) # None vs NaN
+        fresh = self.db.to_dataframe(columns=list(self.data.columns))
+        try:
+            assert_frame_equal(normalize(self.data), normalize(fresh), check_dtype=False, check_like=True)
+            return True
+        except AssertionError as e:
+            print(f"[ERROR] DataFrame is out of sync with database: {e}")
+            return False
+
+    def fetch_due(self, mode: str, limit: int) -> DataFrame:
+        return self.db.fetch_due(mode, limit, time())
+
+    def filter(self, filters: dict[str, list]) -> DataFrame:
+        # In-memory filtering, returns self.data itself when no filter is active
+        return self.filter_engine.apply(filters)
+
+    def search(self, text: str, records: DataFrame = None) -> DataFrame:
+        # Full-text search in the database, rows are taken from records (default: all data)
+        if records is None: records = self.data
+        if not text.strip(): return records
+        rowids = self.db.search_rowids(text)
+        return records.take(flatnonzero(records.index.isin(rowids))) # take: a new frame the table can sort in place
+
+    def sort_rank(self, column: str) -> Series:
+        # Position of every row in the column's ascending German order (see services/collation.py),
+        # NULLs first and ties in rowid order. Computed once per data version, so sorting
+        # filtered records is an integer argsort.
+        if self._sort_ranks_version != self.version:
+            self._sort_ranks = {}
+            self._sort_ranks_version = self.version
+        if column not in self._sort_ranks:
+            keys = self.data[column] if column == "score" else self.data[column].astype(object).map(german_key, na_action="ignore")
+            order = keys.sort_index().sort_values(kind="stable", na_position="first").index
+            self._sort_ranks[column] = Series(arange(len(order)), index=order)
+        return self._sort_ranks[column]
+
+    def sorted_pages(self, column: str, ascending: bool = True, records: DataFrame = None, page_size: int = 500) -> Iterator[list[int]]:
+        # Rowids of records (default: all data) in sort order, one page at a time.
+        # All data on an indexed column is paged from the database, filtered
+        # records and other columns are ordered here on the precomputed ranks.
+        if records is None: records = self.data
+        if records is self.data and column in DBManager.sort_columns:
+            for page in self.db.iter_sorted_rowids(column, ascending, page_size):
+                # Rows a running translation stored before add_rows brought them into the frame
+                page = [rowid for rowid in page if rowid in records.index]
+                if page: yield page
+            return
+        positions = self.sort_rank(column).reindex(records.index).to_numpy().argsort()
+        order = records.index[positions if ascending else positions[::-1]].tolist()
+        for start in range(0, len(order), page_size):
+            yield order[start:start + page_size]
 
-    def fetch_df(self, mode: str, filters: tuple[str, str|list] = None) -> DataFrame:
-        return self.db.to_dataframe(mode, filters=filters)
-    
     def count_rows(self, mode: str = "all"):
-        return self.db.count_rows(mode)
\ No newline at end of file
+        return self.db.count_rows(mode)
+
+    def get_stats(self) -> dict[str, int]:
+        return self.db.fetch_stats()
+
+    def get_daily_stats(self, start: str, end: str) -> DataFrame:
+        self.flush_reviews() # rollups are filled by triggers when queued answers are written
+        return self.db.fetch_daily_stats(start, end)
+
+    def get_period_stats(self, start: str, end: str) -> dict[str, int]:
+        self.flush_reviews()
+        return self.db.fetch_period_stats(start, end)
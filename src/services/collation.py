@@ -0,0 +1,18 @@
+from functools import lru_cache
+from unicodedata import normalize, combining
+
+# German dictionary order (DIN 5007-1): case and accents only decide between otherwise equal words,
+# ä/ö/ü sort as a/o/u and ß as ss. "Apfel" < "Äpfel" < "apfeln" < "Bär" < "Straße" < "Strassen".
+COLLATION = "GERMAN"
+
+@lru_cache(maxsize=65536) # SQLite compares the same values over and over while sorting
+def german_key(text: str) -> str:
+    # Comparable string: base letters, then case-folded text, then the text itself as tie-breakers
+    folded = text.casefold() # ß -> ss
+    base = "".join(char for char in normalize("NFD", folded) if not combining(char))
+    return f"{base}\x00{folded}\x00{text}"
+
+def german_collation(a: str, b: str) -> int:
+    # sqlite3 collation callback, registered as COLLATE GERMAN on every connection
+    a, b = german_key(a), german_key(b)
+    return (a > b) - (a < b)
@@ -0,0 +1,111 @@
+import sqlite3
+from atexit import register
+from contextlib import contextmanager
+from pathlib import Path
+from queue import Queue, Empty
+from threading import Lock, RLock, get_ident
+from services.collation import COLLATION, german_collation
+
+class ConnectionManager:
+    # One manager per database file, shared by every DBManager/DFManager in the process
+    _instances: dict[Path, "ConnectionManager"] = {}
+    _instances_lock = Lock()
+
+    busy_timeout = 5000 # ms
+    pragmas = {
+        "synchronous": "NORMAL", # safe with WAL, avoids fsync on every commit
+        "temp_store": "MEMORY",
+        "cache_size": -16000,    # ~16 MB page cache
+        "mmap_size": 64 * 1024 * 1024,
+    }
+
+    def __init__(self, path: Path, readers: int = 3):
+        self.path = Path(path)
+        self.max_readers = readers
+        self._write_lock = RLock()
+        self._write_owner = None
+        self._readers: Queue[sqlite3.Connection] = Queue()
+        self._readers_created = 0
+        self._readers_lock = Lock()
+        self._closed = False
+
+        self.writer = self._open()
+        self.writer.execute("PRAGMA journal_mode=WAL;")
+        print(f"[INFO] Connected to database at {self.path} (WAL)")
+
+    @classmethod
+    def get(cls, path: Path, readers: int = 3) -> "ConnectionManager":
+        key = Path(path).resolve()
+        with cls._instances_lock:
+            manager = cls._instances.get(key)
+            if manager is None or manager._closed:
+                manager = cls(key, readers)
+                cls._instances[key] = manager
+                register(manager.close)
+            return manager
+
+    def _open(self, read_only: bool = False) -> sqlite3.Connection:
+        if read_only:
+            uri = f"{self.path.as_uri()}?mode=ro"
+            connection = sqlite3.connect(uri, uri=True, timeout=self.busy_timeout / 1000, check_same_thread=False)
+        else:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout / 1000, check_same_thread=False)
+        connection.execute(f"PRAGMA busy_timeout={self.busy_timeout};")
+        for pragma, value in self.pragmas.items():
+            connection.execute(f"PRAGMA {pragma}={value};")
+        # Needed by every statement touching the COLLATE GERMAN indexes, writes to vocabulary included
+        connection.create_collation(COLLATION, german_collation)
+        return connection
+
+    @contextmanager
+    def write(self):
+        # Serialized access to the single writer connection, commits on success
+        with self._write_lock:
+            outer = self._write_owner is None
+            self._write_owner = get_ident()
+            try:
+                yield self.writer
+                if outer: self.writer.commit()
+            except Exception:
+                if outer: self.writer.rollback()
+                raise
+            finally:
+                if outer: self._write_owner = None
+
+    @contextmanager
+    def read(self):
+        # Writer thread reads its own uncommitted changes, everyone else uses the reader pool
+        if self._write_owner == get_ident():
+            yield self.writer
+            return
+
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction: connection.rollback()
+            self._readers.put(connection)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except Empty:
+            pass
+        with self._readers_lock:
+            if self._readers_created < self.max_readers:
+                self._readers_created += 1
+                return self._open(read_only=True)
+        return self._readers.get() # wait for a free reader
+
+    def close(self):
+        if self._closed: return
+        self._closed = True
+        while True:
+            try: self._readers.get_nowait().close()
+            except Empty: break
+        with self._write_lock:
+            try:
+                self.writer.execute("PRAGMA optimize;")
+            except sqlite3.Error as e:
+                print(f"[WARN] PRAGMA optimize failed: {e}")
+            self.writer.close()
@@ -0,0 +1,56 @@
+from pandas import DataFrame, Series
+from services.DB_manager import DBManager
+
+class FilterEngine:
+    # Evaluates table filters on the cached DataFrame with boolean masks.
+    # Masks are indexed by rowid and rebuilt once per DFManager data version.
+    def __init__(self, df_manager):
+        self.df_manager = df_manager
+        self._version = None
+        self._masks: dict[tuple[str, object], Series] = {}
+
+    def _check_version(self):
+        if self._version != self.df_manager.version:
+            self._masks = {}
+            self._version = self.df_manager.version
+            self._build_group_masks()
+
+    def _build_group_masks(self):
+        data = self.df_manager.data
+        if data.empty or "type" not in data.columns: return
+        types = data["type"]
+        any_group = Series(False, index=data.index)
+        for group, values in DBManager.type_groups.items():
+            mask = types.isin(values)
+            self._masks[("TYPE", group.removesuffix("s"))] = mask # chips use singular names
+            any_group |= mask
+        self._masks[("TYPE", "other")] = ~any_group
+        self._masks[("special", "duplicates")] = data.duplicated(["type", "german"], keep=False)
+        self._masks[("special", "nulls")] = data["translation"].isna()
+
+    def mask(self, column: str, value) -> Series:
+        # Group and special masks are prebuilt, plain column values are built on first use
+        self._check_version()
+        key = (column, value)
+        if key not in self._masks:
+            data = self.df_manager.data
+            match column:
+                case "type" : self._masks[key] = data["type"] == value
+                case "score": self._masks[key] = data["score"] == int(value)
+                case _      : raise ValueError(f"Unknown filter {column}={value}")
+        return self._masks[key]
+
+    def apply(self, filters: dict[str, list]) -> DataFrame:
+        # Values inside a category are OR-ed, categories are AND-ed
+        data = self.df_manager.data
+        active = {column: values for column, values in filters.items() if values}
+        if not active or data.empty: return data
+
+        combined = None
+        for column, values in active.items():
+            column_mask = None
+            for value in values:
+                mask = self.mask(column, value)
+                column_mask = mask if column_mask is None else column_mask | mask
+            combined = column_mask if combined is None else combined & column_mask
+        return data.loc[combined.index[combined.to_numpy()]]
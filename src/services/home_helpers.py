@@ -1,11 +1,18 @@
 from services.settings import SettingsManager
-from services.translator import Netzverb
 from services.DF_manager import DFManager
 
-from datetime import datetime
-from random import choice
+from datetime import datetime, timedelta
+from pandas import concat
+from random import shuffle
+from threading import Thread, Lock
 
 class DayWord():
+    # Words of the day are served from a pool of fetched candidates kept in settings,
+    # the pool is refilled in the background so the home screen never waits for Netzverb
+    pool_size = 5
+    _pool_lock = Lock()
+    _refilling = False
+
     def __init__(self):
         self.settings = SettingsManager()
 
@@ -14,22 +21,23 @@ class DayWord():
         self.saved = False
         self.load_word()
         self.actualize_word()
+        self.refill_pool()
 
-    def get_word_data(self):
-        words = Netzverb.get_random_words()
-        if words == None: 
-            self.load_word()
-            # call dialog and say couldn't retrieve new word
-            print("Could not retrieve new word")
-        else: 
-            self.word_data = None
+    def get_word_data(self) -> bool:
+        # Takes next word from the pool, returns False if the pool is empty
+        with DayWord._pool_lock:
+            pool = self.settings.get("day_word.pool", [])
+            if not pool:
+                print("Word pool is empty, keeping current word")
+                self.load_word()
+                return False
+            self.word_data = pool.pop(0)
             self.saved = False
-            while self.word_data == None:
-                word = choice(words) # choose random word
-                print(f"Getting info for {word}")
-                self.word_data = Netzverb.get_noun_data(word, self.settings._data)
+            self.settings.set("day_word.pool", pool)
             self.save_word()
             print("New word saved to settings")
+        self.refill_pool()
+        return True
 
     def save_word(self):
         self.settings.set("day_word.date", str(self.today))
@@ -53,26 +61,98 @@ class DayWord():
         self.settings.set("day_word.saved", self.saved)
         self.settings.save()
 
+    def refill_pool(self):
+        with DayWord._pool_lock:
+            needed = self.pool_size - len(self.settings.get("day_word.pool", []))
+            if DayWord._refilling or needed <= 0: return
+            DayWord._refilling = True
+        Thread(target=self._refill, args=(needed, dict(self.settings.data)), daemon=True).start()
+
+    def _refill(self, needed: int, settings_data: dict):
+        try:
+            current = settings_data.get("day_word", {})
+            exclude = {word["german"] for word in current.get("pool", [])}
+            if current.get("data"): exclude.add(current["data"]["german"])
+            candidates = self.fetch_candidates(needed, settings_data, exclude)
+            if not candidates: return
+
+            with DayWord._pool_lock:
+                pool = self.settings.get("day_word.pool", [])
+                pool.extend(candidates[:max(self.pool_size - len(pool), 0)])
+                previous_date = datetime.strptime(self.settings.get("day_word.date"), "%Y-%m-%d").date()
+                if self.today > previous_date and pool: # no word for today yet, serve it on next visit
+                    self.settings.set("day_word.date", str(self.today))
+                    self.settings.set("day_word.saved", False)
+                    self.settings.set("day_word.data", pool.pop(0))
+                self.settings.set("day_word.pool", pool)
+                self.settings.save()
+                print(f"Word pool refilled ({len(pool)} words)")
+        finally:
+            DayWord._refilling = False
+
+    @staticmethod
+    def fetch_candidates(needed: int, settings_data: dict, exclude: set[str] = ()) -> list[dict]:
+        from services.translator import Netzverb # translation stack only loads when new words are needed
+        words = Netzverb.get_random_words()
+        if words == None:
+            print("Could not retrieve new words")
+            return []
+        shuffle(words)
+        candidates = []
+        for word in words[:needed * 3]: # bounded number of attempts
+            if len(candidates) >= needed: break
+            if word in exclude: continue
+            print(f"Getting info for {word}")
+            word_data = Netzverb.get_noun_data(word, settings_data)
+            if word_data != None: candidates.append(word_data)
+        return candidates
+
 
 class Statistics():
+    history_days = 14
+    daily_columns = ["reviews", "correct", "learned"] # the rest of daily_stats are running totals
+    vocabulary_columns = ["nouns", "verbs", "adjectives", "other"] # vocabulary size by type
+
     def __init__(self, df_manager: DFManager):
         self.df_manager = df_manager
 
-        self.words_count = self.df_manager.count_rows("all")
-        self.duplicates = self.df_manager.count_rows("duplicates")
-        self.nulls = self.df_manager.count_rows("nulls")
-        self.new = self.df_manager.count_rows("new")
-        self.repeat = self.df_manager.count_rows("repeat")
-        self.learnt = self.df_manager.count_rows("learnt")
-        self.nouns = self.df_manager.count_rows("nouns")
-        self.verbs = self.df_manager.count_rows("verbs")
-        self.adjectives = self.df_manager.count_rows("adjectives")
-        self.other = self.df_manager.count_rows("other")
+        stats = self.df_manager.get_stats() # single pass over the vocabulary
+        self.words_count = stats["all_words"]
+        self.duplicates = stats["duplicates"]
+        self.nulls = stats["nulls"]
+        self.new = stats["new"]
+        self.repeat = stats["repeat"]
+        self.learnt = stats["learnt"]
+        self.nouns = stats["nouns"]
+        self.verbs = stats["verbs"]
+        self.adjectives = stats["adjectives"]
+        self.other = stats["other"]
 
         self.bad_vals_flag = bool(self.duplicates or self.nulls)
+        self.load_history()
+
+    def load_history(self):
+        # Last history_days days from the daily rollups, days without a row are filled in:
+        # zero for the day counters, the previous running totals for the rest
+        today = datetime.today().date()
+        self.days = [str(today - timedelta(days=n)) for n in reversed(range(self.history_days))]
+        rows = self.df_manager.get_daily_stats(self.days[0], self.days[-1])
+        daily = rows[self.daily_columns].reindex(self.days, fill_value=0)
+        totals = rows.drop(columns=self.daily_columns)
+        totals = totals.reindex(totals.index.union(self.days)).ffill()
+        # Days before the first row: the vocabulary predates the rollups, its earliest known size holds
+        current = {column: getattr(self, column) for column in self.vocabulary_columns}
+        totals[self.vocabulary_columns] = totals[self.vocabulary_columns].bfill().fillna(current)
+        totals = totals.fillna(0).loc[self.days]
+        self.history = concat([daily, totals], axis=1).astype(int)
+
+        period = self.df_manager.get_period_stats(self.days[0], self.days[-1])
+        self.period_reviews = period["reviews"]
+        self.period_learned = period["learned"]
+        self.period_accuracy = int(period["correct"] / period["reviews"] * 100) if period["reviews"] else 0
 
     def get_stats(self, mode: str) -> list[dict]:
-        # Mode - type, score, bad_vals
+        # Mode - type, score, reviews, vocabulary, bad_vals
         match mode:
             case "type": stats = [
                 {"name": "Nouns", "count": int(self.nouns)},
@@ -85,6 +165,14 @@ class Statistics():
                 {"name": "New", "count": self.new},
                 {"name": "Unlearned", "count": self.repeat}
             ]
+            case "reviews": stats = [
+                {"name": day[5:], "values": {"Correct": int(row.correct), "Repeat": int(row.reviews - row.correct)}}
+                for day, row in self.history.iterrows()
+            ]
+            case "vocabulary": stats = [
+                {"name": day[5:], "values": {"Nouns": int(row.nouns), "Verbs": int(row.verbs), "Adjectives": int(row.adjectives), "Other": int(row.other)}}
+                for day, row in self.history.iterrows()
+            ]
             case "bad_vals": stats = [
                 {"name": "Duplicates", "count": self.duplicates},
                 {"name": "Nulls", "count": self.nulls},
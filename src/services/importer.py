@@ -0,0 +1,93 @@
+from re import compile
+from pathlib import Path
+from typing import Iterator, Iterable
+from pandas import DataFrame
+from services.DB_manager import DBManager
+from services.nlp import PosTagger
+
+class Importer:
+    # Streams word lists into the import_staging table chunk by chunk, memory use
+    # depends on chunk_size and not on the size of the input
+    chunk_size = 2000
+    articles = ("der", "die", "das")
+    _entry = compile(r"[^,\n;\t]+") # entries are separated by comma, semicolon, newline or tab
+
+    policies = ("skip", "refresh", "insert") # for words already in the vocabulary
+
+    def __init__(self, db: DBManager = None, progress_callback: callable = None, policy: str = "skip"):
+        self.db = db if db else DBManager()
+        self.progress_callback = progress_callback # progress_callback(current, total)
+        self.policy = policy if policy in self.policies else "skip"
+        self.stats = {"read": 0, "existing": 0, "staged": 0}
+
+    @classmethod
+    def noun_type(cls, phrase: str) -> tuple[str | None, str]:
+        # "der Hund" -> ("der", "Hund"), "laufen" -> (None, "laufen")
+        words = phrase.strip().split()
+        if words and words[0].lower() in cls.articles:
+            return words[0].lower(), " ".join(words[1:])
+        return None, phrase.strip()
+
+    def entries_from_text(self, text: str) -> Iterator[tuple[str, int]]:
+        for match in self._entry.finditer(text):
+            yield match.group(), match.end()
+
+    def entries_from_file(self, path: str | Path) -> Iterator[tuple[str, int]]:
+        # Line by line in binary mode, so progress can be counted in bytes
+        position = 0
+        with open(path, "rb") as f:
+            for raw_line in f:
+                position += len(raw_line)
+                line = raw_line.decode("utf-8", errors="replace").lstrip("\ufeff")
+                for match in self._entry.finditer(line):
+                    yield match.group(), position
+
+    def import_text(self, text: str) -> dict[str, int]:
+        return self.run(self.entries_from_text(text), len(text))
+
+    def import_file(self, path: str | Path) -> dict[str, int]:
+        return self.run(self.entries_from_file(path), Path(path).stat().st_size)
+
+    def run(self, entries: Iterable[tuple[str, int]], total: int) -> dict[str, int]:
+        self.stats = {"read": 0, "existing": 0, "staged": 0}
+        chunk = []
+        for entry, position in entries:
+            entry = entry.strip()
+            if entry: chunk.append(entry)
+            if len(chunk) >= self.chunk_size:
+                self._stage(chunk)
+                chunk = []
+                if self.progress_callback: self.progress_callback(position, total)
+        if chunk: self._stage(chunk)
+        if self.progress_callback: self.progress_callback(total, total)
+        print(f"[INFO] Import finished: {self.stats}")
+        return self.stats
+
+    def _stage(self, chunk: list[str]):
+        self.stats["read"] += len(chunk)
+        pairs = list(dict.fromkeys(pair for pair in map(self.noun_type, chunk) if pair[1])) # keeps order, drops repeats
+
+        # POS only for entries without an article, one batched pass per chunk
+        untagged = [german for article, german in pairs if article is None]
+        tags = iter(PosTagger.tag(untagged) if untagged else [])
+        pairs = [(article if article else next(tags), german) for article, german in pairs]
+
+        # Known words are handled by policy before they reach the translation queue
+        existing = self.db.find_existing(pairs) if self.policy != "insert" else {}
+        rows = []
+        for word_type, german in pairs:
+            rowid = existing.get(DBManager.word_key(word_type, german))
+            if rowid is not None and self.policy == "skip": continue
+            rows.append((word_type, german, self.policy, rowid))
+        self.stats["existing"] += len(pairs) - len(rows)
+        self.stats["staged"] += self.db.stage_words(rows)
+
+    def staged(self, limit: int = None) -> DataFrame:
+        return self.db.fetch_staged(limit)
+
+    def counts(self) -> dict[str, int]:
+        # Words left in the queue by status
+        return {status: count for status, count in self.db.count_jobs().items() if status != "done"}
+
+    def clear(self):
+        self.db.clear_staged()
@@ -0,0 +1,295 @@
+import sqlite3
+from typing import Callable
+
+# German letters folded to ASCII for the search index, so "Strasse" finds "Straße" and "ae" finds "ä".
+# unicode61 with remove_diacritics handles case and the remaining accents.
+UMLAUT_FOLDS = (("ä", "ae"), ("Ä", "ae"), ("ö", "oe"), ("Ö", "oe"), ("ü", "ue"), ("Ü", "ue"), ("ß", "ss"), ("ẞ", "ss"))
+FTS_COLUMNS = ("german", "translation", "second_translation", "meaning", "example")
+
+def fold_sql(expression: str) -> str:
+    # Nested replace() applying UMLAUT_FOLDS inside SQL
+    for letter, replacement in UMLAUT_FOLDS:
+        expression = f"replace({expression}, '{letter}', '{replacement}')"
+    return expression
+
+def _fts_values(prefix: str) -> str:
+    # Original text plus its folded form when they differ: "Mädchen maedchen"
+    # matches "madchen" (via remove_diacritics) as well as "maedchen"
+    values = []
+    for column in FTS_COLUMNS:
+        original, folded = f"{prefix}{column}", fold_sql(f"{prefix}{column}")
+        values.append(f"{original} || CASE WHEN {original} <> {folded} THEN ' ' || {folded} ELSE '' END")
+    return ", ".join(values)
+
+# Type groups of DBManager.type_groups as daily_stats columns, everything else counts as "other".
+# Kept as literals like the rest of the schema, steps must not change once released.
+STATS_TYPE_GROUPS = (
+    ("nouns", ("NOUN", "PROPN", "der", "die", "das")),
+    ("verbs", ("VERB", "AUX")),
+    ("adjectives", ("ADJ", "ADP", "ADV")),
+)
+STATS_TOTALS = ("total_reviews", "total_correct", "total_learned", "nouns", "verbs", "adjectives", "other")
+
+def _type_flags(row: str) -> list[tuple[str, str]]:
+    # (column, "<row>type IN (...)") per stats type column
+    flags, all_types = [], []
+    for column, types in STATS_TYPE_GROUPS:
+        values = ", ".join(f"'{t}'" for t in types)
+        flags.append((column, f"{row}type IN ({values})"))
+        all_types.append(values)
+    flags.append(("other", f"{row}type NOT IN ({', '.join(all_types)})"))
+    return flags
+
+def _type_deltas(row: str, sign: str) -> str:
+    # "nouns = nouns + (new.type IN (...)), ..." for one inserted (+) or deleted (-) row
+    return ", ".join(f"{column} = {column} {sign} ({flag})" for column, flag in _type_flags(row))
+
+def _ensure_day(day: str) -> str:
+    # Creates the row of a day with the running totals of the latest earlier day (or zeros)
+    return f"""INSERT OR IGNORE INTO daily_stats (day, {", ".join(STATS_TOTALS)})
+            SELECT {day}, {", ".join(STATS_TOTALS)} FROM (
+                SELECT * FROM (SELECT day, {", ".join(STATS_TOTALS)} FROM daily_stats WHERE day < {day} ORDER BY day DESC LIMIT 1)
+                UNION ALL SELECT '', {", ".join("0" for _ in STATS_TOTALS)}
+            ) ORDER BY day DESC LIMIT 1;"""
+
+TODAY = "date('now', 'localtime')"
+REVIEW_DAY = "date(new.reviewed_at, 'unixepoch', 'localtime')"
+
+# Ordered schema steps. Position in the list (starting at 1) is the schema version stored
+# in PRAGMA user_version, so new steps are only ever appended.
+# A step is a list of SQL statements and/or callables taking the connection.
+MIGRATIONS: list[list[str | Callable[[sqlite3.Connection], None]]] = [
+    # 1 - base table
+    [
+        """
+        CREATE TABLE IF NOT EXISTS vocabulary (
+            type TEXT NOT NULL,
+            german TEXT NOT NULL,
+            translation TEXT,
+            second_translation TEXT,
+            example TEXT,
+            meaning TEXT,
+            score INTEGER NOT NULL DEFAULT 0
+        ); """,
+    ],
+    # 2 - indexes for fetch_data / create_filter_query predicates and fetch_stats
+    [
+        # type IN (...), (type, german) duplicates; covers the stats scan as well
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_type_german ON vocabulary(type, german, score, translation);",
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_score ON vocabulary(score);",
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_nulls ON vocabulary(translation) WHERE translation IS NULL;",
+        """CREATE INDEX IF NOT EXISTS idx_vocabulary_other ON vocabulary(type)
+        WHERE type NOT IN ('NOUN', 'VERB', 'ADJ', 'PROPN', 'AUX', 'ADP', 'ADV', 'der', 'die', 'das');""",
+        "ANALYZE;",
+    ],
+    # 3 - full-text search, vocabulary_fts rowid is the vocabulary rowid
+    [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS vocabulary_fts USING fts5(
+            {", ".join(FTS_COLUMNS)},
+            tokenize="unicode61 remove_diacritics 2",
+            prefix='2 3'
+        );""",
+        f"""CREATE TRIGGER IF NOT EXISTS vocabulary_fts_insert AFTER INSERT ON vocabulary BEGIN
+            INSERT INTO vocabulary_fts(rowid, {", ".join(FTS_COLUMNS)}) VALUES (new.rowid, {_fts_values("new.")});
+        END;""",
+        """CREATE TRIGGER IF NOT EXISTS vocabulary_fts_delete AFTER DELETE ON vocabulary BEGIN
+            DELETE FROM vocabulary_fts WHERE rowid = old.rowid;
+        END;""",
+        # score updates from flashcards do not touch the index
+        f"""CREATE TRIGGER IF NOT EXISTS vocabulary_fts_update AFTER UPDATE OF {", ".join(FTS_COLUMNS)} ON vocabulary BEGIN
+            DELETE FROM vocabulary_fts WHERE rowid = old.rowid;
+            INSERT INTO vocabulary_fts(rowid, {", ".join(FTS_COLUMNS)}) VALUES (new.rowid, {_fts_values("new.")});
+        END;""",
+        "DELETE FROM vocabulary_fts;",
+        f"INSERT INTO vocabulary_fts(rowid, {', '.join(FTS_COLUMNS)}) SELECT rowid, {_fts_values('')} FROM vocabulary;",
+    ],
+    # 4 - staging table for imported words waiting for translation
+    [
+        """
+        CREATE TABLE IF NOT EXISTS import_staging (
+            id INTEGER PRIMARY KEY,
+            type TEXT NOT NULL,
+            german TEXT NOT NULL,
+            UNIQUE (german, type)
+        ); """,
+        # existing word lookups during import
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_german ON vocabulary(german);",
+    ],
+    # 5 - staging rows become translation jobs: pending -> in_flight -> done | failed
+    [
+        "ALTER TABLE import_staging ADD COLUMN status TEXT NOT NULL DEFAULT 'pending';",
+        "ALTER TABLE import_staging ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0;",
+        "ALTER TABLE import_staging ADD COLUMN last_error TEXT;",
+        "ALTER TABLE import_staging ADD COLUMN next_attempt REAL NOT NULL DEFAULT 0;", # unix time, retry backoff
+        "CREATE INDEX IF NOT EXISTS idx_import_staging_queue ON import_staging(status, next_attempt);",
+    ],
+    # 6 - duplicate check before fetching: case-insensitive german lookups and per-word policies
+    [
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_german_nocase ON vocabulary(german COLLATE NOCASE);",
+        "DROP INDEX IF EXISTS idx_vocabulary_german;", # replaced by the NOCASE index
+        "ALTER TABLE import_staging ADD COLUMN policy TEXT NOT NULL DEFAULT 'skip';", # skip | refresh | insert
+        "ALTER TABLE import_staging ADD COLUMN target_rowid INTEGER;", # vocabulary row a refresh job updates
+    ],
+    # 7 - SM-2 schedule per word, see services/scheduler.py. due is unix time, interval is in days.
+    [
+        "ALTER TABLE vocabulary ADD COLUMN due REAL NOT NULL DEFAULT 0;", # new words are due right away
+        "ALTER TABLE vocabulary ADD COLUMN interval REAL NOT NULL DEFAULT 0;",
+        "ALTER TABLE vocabulary ADD COLUMN ease REAL NOT NULL DEFAULT 2.5;",
+        "ALTER TABLE vocabulary ADD COLUMN lapses INTEGER NOT NULL DEFAULT 0;",
+        "ALTER TABLE vocabulary ADD COLUMN reps INTEGER NOT NULL DEFAULT 0;",
+        # Old scores become schedules: -1 failed and due now, 1/2/3 after 1/2/3 good reviews.
+        # Due dates are spread over the interval by rowid so old cards do not all fall due on one day.
+        """UPDATE vocabulary SET
+            reps     = CASE score WHEN 1 THEN 1 WHEN 2 THEN 2 WHEN 3 THEN 3 ELSE 0 END,
+            interval = CASE score WHEN 1 THEN 1 WHEN 2 THEN 6 WHEN 3 THEN 15 ELSE 0 END,
+            ease     = CASE score WHEN -1 THEN 1.96 WHEN 1 THEN 2.36 WHEN 3 THEN 2.6 ELSE 2.5 END,
+            lapses   = CASE score WHEN -1 THEN 1 ELSE 0 END,
+            due      = CAST(strftime('%s', 'now') AS REAL) + 86400 * ((rowid % 10) + 1) / 10.0 *
+                       CASE score WHEN 1 THEN 1 WHEN 2 THEN 6 WHEN 3 THEN 15 ELSE 0 END -- SET expressions see the old interval
+        WHERE score != 0;""",
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_due ON vocabulary(due);",
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_score_due ON vocabulary(score, due);", # new cards deck
+        "DROP INDEX IF EXISTS idx_vocabulary_score;", # prefix of idx_vocabulary_score_due
+        "ANALYZE;",
+    ],
+    # 8 - append-only log of flashcard answers
+    [
+        """
+        CREATE TABLE IF NOT EXISTS review_log (
+            id INTEGER PRIMARY KEY,
+            word_rowid INTEGER NOT NULL,    -- vocabulary rowid
+            reviewed_at REAL NOT NULL,      -- unix time
+            old_score INTEGER,
+            new_score INTEGER NOT NULL,
+            latency REAL,                   -- seconds from showing the card to the answer
+            interval REAL,
+            ease REAL
+        ); """,
+        "CREATE INDEX IF NOT EXISTS idx_review_log_word ON review_log(word_rowid);",
+        "CREATE INDEX IF NOT EXISTS idx_review_log_time ON review_log(reviewed_at);",
+        """CREATE TRIGGER IF NOT EXISTS review_log_no_update BEFORE UPDATE ON review_log BEGIN
+            SELECT RAISE(ABORT, 'review_log is append-only');
+        END;""",
+        """CREATE TRIGGER IF NOT EXISTS review_log_no_delete BEFORE DELETE ON review_log BEGIN
+            SELECT RAISE(ABORT, 'review_log is append-only');
+        END;""",
+    ],
+    # 9 - daily learning rollups. Day columns count that day only, total_* and the type
+    # columns are running totals up to the end of the day, so a range is two row lookups.
+    # Rows are kept up to date by triggers, days without activity have no row.
+    [
+        """
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            day TEXT PRIMARY KEY,                       -- local date, YYYY-MM-DD
+            reviews INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,         -- answers other than "Repeat"
+            learned INTEGER NOT NULL DEFAULT 0,         -- new words answered correctly for the first time
+            total_reviews INTEGER NOT NULL DEFAULT 0,
+            total_correct INTEGER NOT NULL DEFAULT 0,
+            total_learned INTEGER NOT NULL DEFAULT 0,
+            nouns INTEGER NOT NULL DEFAULT 0,           -- vocabulary size by type
+            verbs INTEGER NOT NULL DEFAULT 0,
+            adjectives INTEGER NOT NULL DEFAULT 0,
+            other INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID; """,
+        # day >= ...: later days only exist after a clock change, their totals are kept right as well
+        f"""CREATE TRIGGER IF NOT EXISTS daily_stats_review AFTER INSERT ON review_log BEGIN
+            {_ensure_day(REVIEW_DAY)}
+            UPDATE daily_stats SET
+                reviews = reviews + (day = {REVIEW_DAY}),
+                correct = correct + (day = {REVIEW_DAY} AND new.new_score > 0),
+                learned = learned + (day = {REVIEW_DAY} AND new.old_score = 0 AND new.new_score > 0),
+                total_reviews = total_reviews + 1,
+                total_correct = total_correct + (new.new_score > 0),
+                total_learned = total_learned + (new.old_score = 0 AND new.new_score > 0)
+            WHERE day >= {REVIEW_DAY};
+        END;""",
+        f"""CREATE TRIGGER IF NOT EXISTS daily_stats_insert AFTER INSERT ON vocabulary BEGIN
+            {_ensure_day(TODAY)}
+            UPDATE daily_stats SET {_type_deltas("new.", "+")} WHERE day >= {TODAY};
+        END;""",
+        f"""CREATE TRIGGER IF NOT EXISTS daily_stats_delete AFTER DELETE ON vocabulary BEGIN
+            {_ensure_day(TODAY)}
+            UPDATE daily_stats SET {_type_deltas("old.", "-")} WHERE day >= {TODAY};
+        END;""",
+        f"""CREATE TRIGGER IF NOT EXISTS daily_stats_type AFTER UPDATE OF type ON vocabulary BEGIN
+            {_ensure_day(TODAY)}
+            UPDATE daily_stats SET {_type_deltas("old.", "-")} WHERE day >= {TODAY};
+            UPDATE daily_stats SET {_type_deltas("new.", "+")} WHERE day >= {TODAY};
+        END;""",
+        # Backfill from the review log. Word insert dates were never stored, so every
+        # backfilled day gets today's vocabulary size.
+        """INSERT OR IGNORE INTO daily_stats (day, reviews, correct, learned)
+        SELECT date(reviewed_at, 'unixepoch', 'localtime'), COUNT(*), SUM(new_score > 0), SUM(old_score = 0 AND new_score > 0)
+        FROM review_log GROUP BY 1;""",
+        """UPDATE daily_stats SET total_reviews = running.reviews, total_correct = running.correct, total_learned = running.learned
+        FROM (
+            SELECT day, SUM(reviews) OVER w AS reviews, SUM(correct) OVER w AS correct, SUM(learned) OVER w AS learned
+            FROM daily_stats WINDOW w AS (ORDER BY day)
+        ) AS running WHERE daily_stats.day = running.day;""",
+        _ensure_day(TODAY),
+        f"""UPDATE daily_stats SET {", ".join(f"{column} = counts.{column}" for column, _ in _type_flags(""))}
+        FROM (SELECT {", ".join(f"COALESCE(SUM({flag}), 0) AS {column}" for column, flag in _type_flags(""))} FROM vocabulary) AS counts;""",
+    ],
+    # 10 - German dictionary order for the table sort, see services/collation.py. Connections
+    # without the GERMAN collation registered can no longer write to vocabulary.
+    [
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_german_de ON vocabulary(german COLLATE GERMAN);",
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_translation_de ON vocabulary(translation COLLATE GERMAN);",
+        "CREATE INDEX IF NOT EXISTS idx_vocabulary_type_de ON vocabulary(type COLLATE GERMAN);",
+    ],
+    # 11 - staged words wait for Translate: staged -> pending -> in_flight -> done | failed.
+    # Only pending and in-flight jobs are resumed on startup. Jobs never claimed cannot
+    # be told apart from words that were only staged, so they wait for Translate too.
+    [
+        "UPDATE import_staging SET status = 'staged' WHERE status = 'pending' AND attempts = 0;",
+    ],
+    # 12 - "learned" counts answers that move a word into the learnt scores (Good/Easy, 2 and 3),
+    # as in the "learnt" filter, not every answer other than "Repeat". Recounted from the review log.
+    [
+        "DROP TRIGGER IF EXISTS daily_stats_review;",
+        f"""CREATE TRIGGER IF NOT EXISTS daily_stats_review AFTER INSERT ON review_log BEGIN
+            {_ensure_day(REVIEW_DAY)}
+            UPDATE daily_stats SET
+                reviews = reviews + (day = {REVIEW_DAY}),
+                correct = correct + (day = {REVIEW_DAY} AND new.new_score > 0),
+                learned = learned + (day = {REVIEW_DAY} AND new.old_score NOT IN (2, 3) AND new.new_score IN (2, 3)),
+                total_reviews = total_reviews + 1,
+                total_correct = total_correct + (new.new_score > 0),
+                total_learned = total_learned + (new.old_score NOT IN (2, 3) AND new.new_score IN (2, 3))
+            WHERE day >= {REVIEW_DAY};
+        END;""",
+        "UPDATE daily_stats SET learned = 0;",
+        """UPDATE daily_stats SET learned = counts.learned
+        FROM (
+            SELECT date(reviewed_at, 'unixepoch', 'localtime') AS day, SUM(old_score NOT IN (2, 3) AND new_score IN (2, 3)) AS learned
+            FROM review_log GROUP BY 1
+        ) AS counts WHERE daily_stats.day = counts.day;""",
+        """UPDATE daily_stats SET total_learned = running.learned
+        FROM (SELECT day, SUM(learned) OVER (ORDER BY day) AS learned FROM daily_stats) AS running
+        WHERE daily_stats.day = running.day;""",
+    ],
+]
+
+def schema_version(connection: sqlite3.Connection) -> int:
+    return connection.execute("PRAGMA user_version;").fetchone()[0]
+
+def migrate(connection: sqlite3.Connection) -> int:
+    # Bring the database up to the latest version, one transaction per step
+    current = schema_version(connection)
+    for version, steps in enumerate(MIGRATIONS, start=1):
+        if version <= current: continue
+        print(f"[INFO] Migrating database to version {version}")
+        try:
+            connection.execute("BEGIN;")
+            for step in steps:
+                if callable(step): step(connection)
+                else: connection.execute(step)
+            connection.execute(f"PRAGMA user_version={version};")
+            connection.commit()
+        except sqlite3.Error as e:
+            connection.rollback()
+            print(f"[ERROR] Migration to version {version} failed: {e}")
+            raise
+        current = version
+    return current
@@ -0,0 +1,89 @@
+import os
+import zlib
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from time import time
+
+class ResponseCache:
+    # Raw HTML cache under ~/.vocab_app/cache, one zlib-compressed file per URL hash
+    def __init__(self, directory: Path = None, ttl_days: float = 30, max_mb: float = 200):
+        self.directory = directory if directory else Path.home() / ".vocab_app" / "cache"
+        self.ttl = ttl_days * 24 * 3600
+        self.max_size = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._size = None # bytes on disk, counted on first write
+        self._lock = Lock()
+
+    def _path(self, url: str) -> Path:
+        key = sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / key[:2] / f"{key}.z"
+
+    def get(self, url: str, ttl: float = None) -> bytes | None:
+        # ttl (seconds) - overrides the cache ttl for this lookup
+        path = self._path(url)
+        try:
+            modified = path.stat().st_mtime
+            if time() - modified > (self.ttl if ttl is None else ttl): raise FileNotFoundError # expired
+            content = zlib.decompress(path.read_bytes())
+            os.utime(path) # keep recently used entries on eviction
+        except (OSError, zlib.error):
+            with self._lock: self.misses += 1
+            return None
+        with self._lock: self.hits += 1
+        return content
+
+    def put(self, url: str, content: bytes):
+        path = self._path(url)
+        data = zlib.compress(content, 6)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path) # atomic for concurrent readers
+        except OSError as e:
+            print(f"[WARN] Failed to cache {url}: {e}")
+            return
+
+        with self._lock:
+            if self._size is None: self._size = self._disk_size()
+            else: self._size += len(data) - old_size
+            over_limit = self._size > self.max_size
+        if over_limit: self.evict()
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        if not self.directory.exists(): return []
+        entries = []
+        for path in self.directory.glob("*/*.z"):
+            try: entries.append((path, path.stat()))
+            except OSError: pass
+        return entries
+
+    def _disk_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self):
+        # Drop expired entries, then least recently used ones down to 80% of the limit
+        now = time()
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        target = self.max_size * 0.8
+        for path, stat in entries:
+            if now - stat.st_mtime <= self.ttl and size <= target: break
+            try:
+                path.unlink()
+                size -= stat.st_size
+            except OSError: pass
+        with self._lock: self._size = size
+
+    def clear(self):
+        for path, _ in self._entries():
+            try: path.unlink()
+            except OSError: pass
+        with self._lock: self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self._size}
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+from threading import Lock, BoundedSemaphore
+from time import monotonic, sleep
+from urllib.parse import urlparse
+from requests import Session
+from requests.exceptions import ConnectionError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from services.netz_cache import ResponseCache
+
+class NotCached(ConnectionError):
+    # Offline mode and the page is not in the cache, asking again will not change that
+    pass
+
+class RateLimiter:
+    # Token bucket plus a cap on concurrent requests, one instance per host
+    def __init__(self, rate: float, burst: int, max_in_flight: int):
+        self.rate = max(float(rate), 0.01) # tokens per second
+        self.burst = max(int(burst), 1)
+        self.tokens = float(self.burst)
+        self.updated = monotonic()
+        self._lock = Lock()
+        self._in_flight = BoundedSemaphore(max(int(max_in_flight), 1))
+
+    def acquire(self):
+        with self._lock:
+            now = monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1 # reserve a token, going negative means waiting for it
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait: sleep(wait)
+
+    @contextmanager
+    def slot(self):
+        with self._in_flight:
+            self.acquire()
+            yield
+
+class NetzClient:
+    # Defaults, overridden by the "netzverb" section of settings
+    rate = 2.0          # requests per second per host
+    burst = 4
+    max_in_flight = 4   # concurrent requests per host
+    timeout = 15
+    pool_size = 8       # keep-alive connections kept per host
+    retries = 2         # on connection errors and 429/5xx answers
+    compression = True
+    use_cache = True
+    offline = False     # serve from cache only, never touch the network
+
+    cache = ResponseCache()
+    _limiters: dict[str, RateLimiter] = {}
+    _session: Session | None = None
+    _lock = Lock()
+
+    @classmethod
+    def configure(cls, options: dict | None):
+        if not options: return
+        with cls._lock:
+            cls.rate = options.get("rate", cls.rate)
+            cls.burst = options.get("burst", cls.burst)
+            cls.max_in_flight = options.get("max_in_flight", cls.max_in_flight)
+            cls.timeout = options.get("timeout", cls.timeout)
+            cls._limiters = {} # new limits apply to the next requests
+            cls.use_cache = options.get("cache", cls.use_cache)
+            cls.offline = options.get("offline", cls.offline)
+            cls.cache.ttl = options.get("cache_ttl_days", cls.cache.ttl / 86400) * 86400
+            cls.cache.max_size = int(options.get("cache_max_mb", cls.cache.max_size / 1048576) * 1048576)
+
+            session_options = (options.get("pool_size", cls.pool_size), options.get("retries", cls.retries),
+                               options.get("compression", cls.compression))
+            if session_options != (cls.pool_size, cls.retries, cls.compression):
+                cls.pool_size, cls.retries, cls.compression = session_options
+                if cls._session is not None: cls._session.close()
+                cls._session = None # rebuilt with the new pool on next request
+
+    @classmethod
+    def session(cls) -> Session:
+        # One pooled keep-alive session shared by every Netzverb request
+        with cls._lock:
+            if cls._session is None:
+                retry = Retry(
+                    total=cls.retries,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET",),
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=cls.pool_size, pool_maxsize=cls.pool_size, max_retries=retry)
+                session = Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["Accept-Encoding"] = "gzip, deflate" if cls.compression else "identity"
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def limiter(cls, host: str) -> RateLimiter:
+        with cls._lock:
+            if host not in cls._limiters:
+                cls._limiters[host] = RateLimiter(cls.rate, cls.burst, cls.max_in_flight)
+            return cls._limiters[host]
+
+    @classmethod
+    def get(cls, url: str, ttl: float = None) -> bytes:
+        # Raises requests.RequestException on network or HTTP errors.
+        # ttl (seconds) overrides the cache ttl for this url, 0 - always a fresh page while online
+        if cls.use_cache or cls.offline:
+            content = cls.cache.get(url, None if cls.offline else ttl) # offline any cached copy beats none
+            if content is not None: return content
+            if cls.offline: raise NotCached(f"Offline mode, {url} is not cached")
+
+        with cls.limiter(urlparse(url).netloc).slot():
+            response = cls.session().get(url, timeout=cls.timeout)
+            response.raise_for_status()
+        if cls.use_cache: cls.cache.put(url, response.content)
+        return response.content
@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml # optional, C parser, several times faster than html.parser
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+EXAMPLE_PREFIX = "https://www.satzapp.de/?t="
+MEANING_PREFIXES = ("a.", "b.", "c.", "d.", "e.")
+
+@dataclass
+class NetzRecord:
+    # Everything the translator needs from one Netzverb page
+    present: bool = False                   # page has a "Definition..." heading
+    word: str | None = None                 # base form line, e.g. "Hund, der"
+    translations: dict[str, str] = field(default_factory=dict) # lang code -> raw translation text
+    examples: list[str] = field(default_factory=list)
+    meanings: list[str] | None = None       # None when the page has no meanings list
+
+    def translation(self, lang_code: str) -> str | None:
+        if lang_code == "nn" or lang_code not in self.translations: return None
+        words = [word.strip() for word in self.translations[lang_code].split(",")]
+        return ", ".join(words[:4])
+
+    def example(self, n: int) -> str | None:
+        if n == 0: return None
+        return "; ".join(self.examples[:n])
+
+    def meaning(self, n: int) -> str | None:
+        if n == 0 or self.meanings is None: return None
+        return "; ".join(self.meanings[:n])
+
+def _wanted(name: str, attrs: dict) -> bool:
+    # SoupStrainer filter: only subtrees the extractor reads are built
+    classes = attrs.get("class")
+    if isinstance(classes, str): classes = classes.split()
+    match name:
+        case "h1" | "dd": return True
+        case "div"      : return classes == ["rCntr", "rClear"]
+        case "section"  : return classes == ["rBox", "rBoxWht"]
+        case "a"        : return attrs.get("href", "").startswith(EXAMPLE_PREFIX)
+    return False
+
+class PageStrainer(SoupStrainer):
+    # bs4 4.13+ asks allow_tag_creation while parsing, 4.12 asks search_tag
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return _wanted(name, attrs or {})
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return markup_name if _wanted(markup_name, markup_attrs or {}) else None
+
+class NetzParser:
+    parser = PARSER
+    strain = True # parse only the tags in _wanted
+
+    @classmethod
+    def parse(cls, content: bytes | str) -> NetzRecord:
+        # One parse and one walk over the tree for all fields
+        strainer = PageStrainer() if cls.strain else None
+        soup = BeautifulSoup(content, cls.parser, parse_only=strainer)
+        record = NetzRecord()
+        for tag in soup.find_all(True):
+            match tag.name:
+                case "h1":
+                    if tag.string is not None and tag.string.startswith("Definition"): record.present = True
+                case "div":
+                    if record.word is None and tag.get("class") == ["rCntr", "rClear"]:
+                        record.word = tag.text.strip()
+                case "dd":
+                    lang = tag.get("lang")
+                    if lang and lang not in record.translations: # first entry per language
+                        spans = tag.find_all("span")
+                        if len(spans) > 1: record.translations[lang] = spans[1].text
+                case "a":
+                    href = tag.get("href", "")
+                    if href.startswith(EXAMPLE_PREFIX): record.examples.append(href.split("=")[1])
+                case "section":
+                    if record.meanings is None and tag.get("class") == ["rBox", "rBoxWht"]:
+                        record.meanings = cls._meanings(tag)
+        return record
+
+    @staticmethod
+    def _meanings(section) -> list[str] | None:
+        h2 = section.find("h2")
+        if not h2 or h2.text != "Bedeutungen": return None
+        dl = section.find("dl", class_="wNrn")
+        if not dl: return None
+        meanings = []
+        for dd in dl.find_all("dd"):
+            text = dd.text.strip()
+            if text.startswith(MEANING_PREFIXES):
+                text = text[2:]
+            meanings.extend(part.strip() for part in text.split(";") if part.strip())
+        return meanings
+
+def parse_page(content: bytes) -> NetzRecord:
+    # Module level so a process pool can pickle it by reference
+    return NetzParser.parse(content)
@@ -0,0 +1,47 @@
+from threading import Lock, Thread
+
+class PosTagger:
+    # Process-wide spaCy pipeline, loaded once on first use
+    model = "de_core_news_sm" # python -m spacy download de_core_news_sm
+    exclude = ["parser", "ner", "lemmatizer", "senter"] # POS only needs tok2vec, tagger, morphologizer, attribute_ruler
+    batch_size = 256
+    n_process = 1
+
+    _nlp = None
+    _lock = Lock()
+
+    @classmethod
+    def configure(cls, options: dict | None):
+        if not options: return
+        cls.batch_size = int(options.get("batch_size", cls.batch_size))
+        cls.n_process = int(options.get("n_process", cls.n_process))
+
+    @classmethod
+    def get_nlp(cls):
+        if cls._nlp is None:
+            with cls._lock:
+                if cls._nlp is None:
+                    from spacy import load # heavy import, kept out of module import time
+                    cls._nlp = load(cls.model, exclude=cls.exclude)
+                    print(f"[INFO] spaCy model {cls.model} loaded")
+        return cls._nlp
+
+    @classmethod
+    def warm_up(cls):
+        # Load the model in the background so the first "Add" does not wait for it
+        if cls._nlp is not None: return
+        def load_model():
+            try: cls.get_nlp()
+            except (ImportError, OSError) as e: print(f"[WARN] spaCy warm up failed: {e}")
+        Thread(target=load_model, daemon=True).start()
+
+    @classmethod
+    def tag(cls, words: list[str], batch_size: int = None, n_process: int = None) -> list[str]:
+        # POS of the first token of every entry, tagged in batches
+        nlp = cls.get_nlp()
+        docs = nlp.pipe(
+            words,
+            batch_size=batch_size or cls.batch_size,
+            n_process=n_process or cls.n_process
+        )
+        return [doc[0].pos_ if len(doc) else "X" for doc in docs]
@@ -0,0 +1,41 @@
+import sqlite3
+from atexit import register
+from queue import Queue, Empty
+from threading import Thread
+from time import monotonic
+
+class ReviewWriter:
+    # Background writer for flashcard answers: the UI thread only queues them,
+    # answers arriving within flush_interval are written in one transaction
+    batch_size = 64
+    flush_interval = 0.5 # seconds
+
+    def __init__(self, db):
+        self.db = db
+        self._queue: Queue[dict] = Queue()
+        Thread(target=self._run, daemon=True).start()
+        register(self.flush) # registered after the connection, so it runs before it closes
+
+    def record(self, review: dict):
+        # review: rowid, reviewed_at, old_score, latency and the Scheduler.columns
+        self._queue.put(review)
+
+    def flush(self):
+        # Blocks until every queued answer is written
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - monotonic()
+                if timeout <= 0: break
+                try: batch.append(self._queue.get(timeout=timeout))
+                except Empty: break
+            try:
+                self.db.log_reviews(batch)
+            except sqlite3.Error as e:
+                print(f"[ERROR] Failed to save {len(batch)} reviews: {e}")
+            finally:
+                for _ in batch: self._queue.task_done()
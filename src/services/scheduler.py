@@ -0,0 +1,26 @@
+class Scheduler:
+    # SM-2 spaced repetition. The flashcard buttons keep their score values and map to SM-2 quality,
+    # score stays the word's last answer for stats and filters.
+    quality = {-1: 1, 1: 3, 2: 4, 3: 5} # Repeat, Hard, Good, Easy
+    columns = ("score", "due", "interval", "ease", "lapses", "reps")
+    min_ease = 1.3
+    relearn_delay = 600 # seconds, failed cards come back in the same day
+    day = 86400
+
+    @classmethod
+    def review(cls, card, score: int, now: float) -> dict:
+        # New schedule of a card (dict or row with the schedule columns) answered with score
+        q = cls.quality[score]
+        reps, interval, ease, lapses = int(card["reps"]), float(card["interval"]), float(card["ease"]), int(card["lapses"])
+
+        if q < 3: # lapse, learn the card again from the start
+            reps, interval, lapses = 0, 0.0, lapses + 1
+        else:
+            reps += 1
+            if reps == 1: interval = 1.0
+            elif reps == 2: interval = 6.0
+            else: interval = float(round(interval * ease))
+        ease = max(cls.min_ease, ease + 0.1 - (5 - q) * (0.08 + (5 - q) * 0.02))
+        due = now + interval * cls.day if interval else now + cls.relearn_delay
+
+        return {"score": score, "due": due, "interval": interval, "ease": round(ease, 2), "lapses": lapses, "reps": reps}
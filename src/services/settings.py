@@ -1,12 +1,40 @@
 from json import load, dump
 from pathlib import Path
+from threading import Lock, RLock, Timer
+from atexit import register
+from tempfile import NamedTemporaryFile
+import os
 import sys
 
 class SettingsManager:
-    def __init__(self):
+    # One process-wide store, every SettingsManager() returns the same instance
+    _instance = None
+    _instance_lock = Lock()
+    _listeners: list[callable] = []
+    save_delay = 0.5 # seconds, saves within this window are written once
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._setup()
+                cls._instance = instance
+            return cls._instance
+
+    def _setup(self):
         self.file_path = self.get_asset_path("config/settings.json")
         self.lang_path = self.get_asset_path("config/languages.json")
+        self._lock = RLock()
         self._data = self._load()
+        self._langs = None
+        self._dirty: set[str] = set() # top level keys changed since last save
+        self._save_timer: Timer | None = None
+        register(self.flush)
+
+    @classmethod
+    def subscribe(cls, callback: callable):
+        # callback(keys) is called after save with the changed top level keys
+        cls._listeners.append(callback)
 
     def get_asset_path(self, relative_path: str) -> Path:
         base_path = Path(__file__).parent.parent.parent
@@ -22,8 +50,30 @@ class SettingsManager:
         return {}
 
     def save(self):
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            dump(self._data, f, indent=4)
+        # Schedules a write, callers see their changes immediately in memory
+        with self._lock:
+            changed, self._dirty = self._dirty, set()
+            if self._save_timer is None:
+                self._save_timer = Timer(self.save_delay, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+        for callback in self._listeners:
+            callback(changed)
+
+    def flush(self):
+        # Atomic write: dump to a temp file next to settings.json, then rename over it
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            else: return # nothing pending
+            try:
+                with NamedTemporaryFile("w", encoding="utf-8", dir=self.file_path.parent, suffix=".tmp", delete=False) as f:
+                    dump(self._data, f, indent=4)
+                    tmp_path = f.name
+                os.replace(tmp_path, self.file_path)
+            except OSError as e:
+                print(f"[ERROR] Failed to save settings: {e}")
 
     def get(self, key, default=None):
         parts = key.split(".")
@@ -36,20 +86,24 @@ class SettingsManager:
 
     def set(self, key, value):
         parts = key.split(".")
-        d = self._data
-        for part in parts[:-1]:
-            d = d.setdefault(part, {})
-        d[parts[-1]] = value
+        with self._lock:
+            self._dirty.add(parts[0])
+            d = self._data
+            for part in parts[:-1]:
+                d = d.setdefault(part, {})
+            d[parts[-1]] = value
 
     def get_langs(self):
+        if self._langs is not None: return self._langs
         if self.lang_path.exists():
             with open(self.lang_path, "r", encoding="utf-8") as f:
                 langs = load(f)
-                return langs["lang_list"]
-        else: 
+                self._langs = langs["lang_list"]
+                return self._langs
+        else:
             print("Failed to load languages")
             return {"en": "English"}
 
     @property
     def data(self):
-        return self._data
\ No newline at end of file
+        return self._data
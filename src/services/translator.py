@@ -1,15 +1,20 @@
-from re import compile
-from requests import get, RequestException
+from requests import RequestException
 from bs4 import BeautifulSoup
-from pandas import DataFrame, Series, concat, read_csv
-from time import sleep
 from pathlib import Path
-from spacy import load # python -m spacy download de_core_news_sm
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from threading import Lock
+from time import time, sleep
+from services.netz_client import NetzClient, NotCached
+from services.netz_parser import NetzParser, NetzRecord, PARSER, parse_page
+from services.importer import Importer
 
 class TranslationError(Exception):
-    def __init__(self, message: str, found = True):
+    def __init__(self, message: str, found = True, retry = True):
         self.message = str(message)
         self.found = found
+        self.retry = retry # False - the same request would fail again
         super().__init__(self.message)
 
 class Netzverb: 
@@ -17,112 +22,46 @@ class Netzverb:
     base_url = "https://www.verben.de/?w="
     noun_url = "https://www.verben.de/substantive/?w=" # + word + .htm
     conj_url = "https://www.verben.de/konjunktionen/?w="
+    random_url = "https://www.verbformen.com/declension/nouns/Abend.htm"
+    random_ttl = 0 # the page shows new random words on every visit, never served from cache while online
 
     nouns = ["der", "die", "das", "NOUN", "PROPN", "X"]
     verbs = ["VERB", "AUX"]
     adjectives = ["ADJ", "ADV"]
 
     @classmethod
-    def get_html_response(self, word):
-        request_url = f"{self.base_url}{word}"
-        return self._fetch_response(request_url)
+    def url_for(self, word, word_type=None):
+        # Nouns and conjunctions have their own Netzverb sections
+        if word_type in self.nouns: return f"{self.noun_url}{word}"
+        if word_type in ["CONJ", "CCONJ", "SCONJ"]: return f"{self.conj_url}{word}"
+        return f"{self.base_url}{word}"
 
     @classmethod
-    def get_noun_html_response(self, word):
-        request_url = f"{self.noun_url}{word}"
-        return self._fetch_response(request_url)
-    
+    def get_content(self, word, word_type=None) -> bytes:
+        return self._fetch_content(self.url_for(word, word_type))
+
     @classmethod
-    def get_conj_html_response(self, word):
-        request_url = f"{self.conj_url}{word}"
-        return self._fetch_response(request_url)
+    def get_record(self, word, word_type=None) -> NetzRecord:
+        # Page parsed once into a NetzRecord, see services/netz_parser.py
+        return NetzParser.parse(self.get_content(word, word_type))
 
     @classmethod
-    def _fetch_response(self, request_url, sleep_time: int = 1):
+    def _fetch_content(self, request_url, ttl: float = None) -> bytes:
         try:
-            response = get(request_url)
-            response.raise_for_status()  # Raise HTTPError for bad responses
-            sleep(sleep_time)
-            return BeautifulSoup(response.content, "html.parser")
+            return NetzClient.get(request_url, ttl) # rate limited per host
+        except NotCached:
+            raise TranslationError("Not cached in offline mode", retry=False)
         except RequestException as e:
             raise TranslationError(f"Failed to fetch URL")
-        
-    @classmethod # Check whether Netzverb has a page related to specific word
-    def check_netz_presence(self, soup: BeautifulSoup):
-        present = False
-        if soup == None: pass
 
-        if soup.find("h1", string=compile(r"^Definition")):
-            present = True
-        
-        if not present: raise TranslationError("Word not found on Netzverb", False)
-
-    @classmethod
-    def get_translation(self, soup: BeautifulSoup, lang_code: str):
-        if not soup or lang_code == "nn": return None
-        dd = soup.find("dd", lang=lang_code)
-        if not dd: return None
-        span = dd.find_all("span")[1]
-        if not span: return None
-        words = [word.strip() for word in span.text.split(",")]
-        return ", ".join(words[:4])
-    
-    @classmethod
-    def get_example(self, soup: BeautifulSoup, n: int):
-        if soup == None or n == 0: return None
-        examples = []
-        # Find all <a> tags with href attributes
-        anchor_tags = soup.find_all("a", href=True)
-        if not anchor_tags: return None
-        for tag in anchor_tags:
-            href = tag["href"]
-            if href.startswith("https://www.satzapp.de/?t="):
-                sentance = href.split("=")[1]
-                examples.append(sentance)
-        return "; ".join(examples[:n])
-    
-    @classmethod
-    def get_meaning(self, soup: BeautifulSoup, n: int): # class=rBox rBoxWht
-        if soup == None or n == 0: return None
-        list_prefixes = ("a.", "b.", "c.", "d.", "e.")
-        meanings = []
-        sections = soup.find_all("section", class_="rBox rBoxWht")
-        if not sections: return None
-        for section in sections:
-            h2 = section.find("h2")
-            if h2 and h2.text == "Bedeutungen":
-                dl = section.find('dl', class_='wNrn')
-                if dl:
-                    dd_tags = dl.find_all('dd')
-                    for dd in dd_tags:
-                        text = dd.text.strip()
-                        if text.startswith(list_prefixes):
-                            text = text[2:]
-                        for part in text.split(";"):
-                            part = part.strip()  
-                            if part:
-                                meanings.append(part)
-                    return "; ".join(meanings[:n])
-    
     @classmethod
-    def get_word(self, soup: BeautifulSoup):
-        if soup == None: return None
-        return soup.find("div", class_="rCntr rClear").text.strip()
-    
-    @classmethod
-    def check_verb(self, soup: BeautifulSoup):
-        if soup == None: return None
-        section = soup.find_all("section", class_="rBox rBoxWht")[0]
-        span = section.find_all("span", class_="rInf")[0]
-        part = span.find_all("span", attrs={'title': "Verb"})
-        if part:
-            return(part[0].text.upper())
-    
+    def _fetch_response(self, request_url, ttl: float = None):
+        return BeautifulSoup(self._fetch_content(request_url, ttl), PARSER)
+        
     @classmethod
     def get_random_words(self) -> list[str] | None:
-        url_noun = "https://www.verbformen.com/declension/nouns/Abend.htm"
         # url_adj = "https://www.verbformen.com/declension/adjectives/hold.htm"
-        try: soup = self._fetch_response(url_noun, sleep_time=0)
+        try: soup = self._fetch_response(self.random_url, self.random_ttl)
         except TranslationError as _: return None
         
         # Parse response
@@ -135,16 +74,15 @@ class Netzverb:
     
     @classmethod
     def get_noun_data(self, noun: str, settings_) -> dict | None:
-        try: soup = self.get_noun_html_response(noun)
+        try: record = self.get_record(noun, "NOUN")
         except TranslationError as _: return None
 
         settings = settings_
         # check if response is alright and has translation
-        translation = self.get_translation(soup, settings["main_lang"]["code"])
-        if translation == None: return None
+        translation = record.translation(settings["main_lang"]["code"])
+        if translation == None or record.word is None: return None
 
-        base_form = self.get_word(soup)
-        type_and_word = base_form.split(sep=',')
+        type_and_word = record.word.split(sep=',')
         if len(type_and_word) > 2:
             type_and_word = [type_and_word[0], type_and_word[2]]
 
@@ -152,51 +90,56 @@ class Netzverb:
             "type"  :type_and_word[1].strip() if len(type_and_word) > 1 else None,
             "german":type_and_word[0].strip(),
             "translation":translation,
-            "second_translation": self.get_translation(soup, settings["second_lang"]["code"]),
-            "example": self.get_example(soup, settings["examples"]),
-            "meaning": self.get_meaning(soup, settings["meanings"]),
+            "second_translation": record.translation(settings["second_lang"]["code"]),
+            "example": record.example(settings["examples"]),
+            "meaning": record.meaning(settings["meanings"]),
             "score": 0,
         }
-
         return new_word
 
 class Translator:
+    max_attempts = 5     # network failures are retried with exponential backoff
+    backoff_base = 2.0   # seconds before the first retry, doubled for every further one
+    backoff_max = 300.0
+    _run_lock = Lock()   # one queue runner per process
+    preview_rows = 500   # staged words loaded for the preview, the queue itself can be much longer
+    _parse_pool: ProcessPoolExecutor | None = None
+    _parse_pool_size = 0
+
     def __init__(self):
-        self.input_data = Series()
-        self.data = DataFrame()
-        
-    def read_data(self, file):
-        self.input_data = (read_csv(file, header=None, names=["Input"])
-                    .dropna()
-                    .reset_index(drop=True))
+        self.importer = Importer()
+        self.reload() # words imported earlier and not translated yet
+
+    def read_data(self, file, progress_callback=None, policy: str = "skip") -> dict[str, int]:
+        return self._import(lambda: self.importer.import_file(file), progress_callback, policy)
+
+    def add_text(self, text: str, progress_callback=None, policy: str = "skip") -> dict[str, int]:
+        return self._import(lambda: self.importer.import_text(text), progress_callback, policy)
+
+    def _import(self, run: callable, progress_callback=None, policy: str = "skip") -> dict[str, int]:
+        self.importer.progress_callback = progress_callback
+        self.importer.policy = policy if policy in Importer.policies else "skip"
+        stats = run()
+        self.reload()
+        return stats
 
     def noun_type(self, phrase):
-        articles = ["der", "die", "das"]
-        words = phrase.strip().split()
-        if words[0].lower() in articles:
-            article = words[0].lower()
-            noun = " ".join(words[1:])
-            return article, noun
-        else:
-            return None, phrase.strip()
-    
-    def word_type(self):
-        nlp = load("de_core_news_sm", disable=["ner", "parser"])
-        func = lambda x: nlp(x)[0].pos_
-        self.data.type = self.data.type.fillna(self.data.german.apply(func))
-
-    def clean_data(self):
-        cleaned_data = DataFrame()
-        cleaned_data[["type", "german"]] = self.input_data.apply(lambda x: Series(self.noun_type(x)))
-        self.input_data = Series()
-        self.data = concat([self.data, cleaned_data])
-        self.word_type()
+        return Importer.noun_type(phrase)
+
+    def reload(self):
+        # Preview of the words still waiting in the queue, failed ones first, and the queue size by status
+        self.data = self.importer.staged(self.preview_rows)
+        self.counts = self.importer.counts()
+
+    @property
+    def staged_count(self) -> int:
+        return sum(self.counts.values())
 
     def output(self, file_name="vocabulary.csv"):
         out_location = Path(__file__).parent / file_name
 
         # Append if the file exists, otherwise write normally
-        self.data.to_csv(
+        self.importer.staged().to_csv(
             out_location, 
             index=False, 
             mode="a" if out_location.exists() else "w", 
@@ -205,86 +148,139 @@ class Translator:
 
         print(f"Translations saved to {out_location}")
 
+    def translate_word(self, job: dict, settings: dict, parse: callable = NetzParser.parse) -> dict:
+        # Vocabulary record for one staged word, raises TranslationError.
+        # parse turns the raw page into a NetzRecord, in this thread or in the parse pool
+        row = {"type": job["type"], "german": job["german"], "translation": None}
+        if settings["second_lang"]["lang"] != "None":
+            row["second_translation"] = None
+        if settings["examples"]:
+            row["example"] = None
+        if settings["meanings"]:
+            row["meaning"] = None
+        row["score"] = 0
+        word = row["german"]
+
+        print(f"Parsing for {word}")
+        record = parse(Netzverb.get_content(word, row["type"]))
+
+        # Skip processing if word is not present
+        if not record.present: raise TranslationError("Word not found on Netzverb", False)
+
+        # Get the base form and update German/Type columns
+        base_form = record.word or word
+        if base_form.find(",") != -1:
+            type_and_word = base_form.split(sep=',')
+            if len(type_and_word) > 2:
+                type_and_word = [type_and_word[0], type_and_word[2]]
+            row["german"], row["type"] = type_and_word
+            row["type"] = row["type"].strip()
+            row["german"] = row["german"].strip()
+
+        if row["type"] in Netzverb.verbs and record.word:
+            row["german"] = record.word
+
+        # Fill translations and other data
+        row["translation"] = record.translation(settings["main_lang"]["code"])
+        if "second_translation" in row:
+            row["second_translation"] = record.translation(settings["second_lang"]["code"])
+        if "example" in row:
+            row["example"] = record.example(settings["examples"])
+        if "meaning" in row:
+            row["meaning"] = record.meaning(settings["meanings"])
+        return row
+
+    @classmethod
+    def parse_pool(cls, processes: int) -> ProcessPoolExecutor:
+        # Kept between runs, starting worker processes costs more than parsing a few pages
+        if cls._parse_pool is None or cls._parse_pool_size != processes:
+            if cls._parse_pool is not None: cls._parse_pool.shutdown(wait=False)
+            # spawn: forking the threaded app process can deadlock on locks held by other threads
+            cls._parse_pool = ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn"))
+            cls._parse_pool_size = processes
+        return cls._parse_pool
+
+    def _pool_parser(self, processes: int) -> callable:
+        pool = self.parse_pool(processes)
+        def parse(content: bytes) -> NetzRecord:
+            try: return pool.submit(parse_page, content).result()
+            except BrokenProcessPool: # a worker died, finish this run in threads
+                Translator._parse_pool = None
+                return NetzParser.parse(content)
+        return parse
+
+    def backoff(self, attempts: int) -> float:
+        return min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+
     def get_netz_info(self, _settings: dict, progress_callback=None, callback = None):
+        # Works through the import_staging job queue until no pending job is left.
+        # Every word is stored as soon as it is translated, so an interrupted run
+        # loses at most the words in flight, which are picked up again on restart.
         settings = _settings
-        success_count = 0
-        failed_words = []
-        original_shape = self.data.shape[0]
-
-        # Initialize columns dynamically        
-        self.data["translation"] = None
-        if settings["second_lang"]["lang"] != "None": 
-            self.data["second_translation"] = None
-        if settings["examples"]:
-            self.data["example"] = None
-        if settings["meanings"]: 
-            self.data["meaning"] = None
-        self.data["score"] = 0
-        self.data["__drop__"] = False
-        
-        # create meaningful index
-        self.data.index = range(len(self.data))
-
-        def process_row(row):
-            nonlocal success_count, failed_words
-            word = row["german"]
-            
-            print(f"Parsing for {word}")
-            if progress_callback: progress_callback(row.name + 1, self.data.shape[0])
-
-            try:
-                # Determine the correct Netzverb method
-                if row["type"] in Netzverb.nouns:
-                    soup = Netzverb.get_noun_html_response(word)
-                elif row["type"] in ["CONJ", "CCONJ", "SCONJ"]:
-                    soup = Netzverb.get_conj_html_response(word)
-                else:
-                    soup = Netzverb.get_html_response(word)
-
-                # Skip processing if word is not present
-                Netzverb.check_netz_presence(soup)
-
-                # Get the base form and update German/Type columns
-                base_form = Netzverb.get_word(soup)
-                if base_form.find(",") != -1:
-                    type_and_word = base_form.split(sep=',')
-                    if len(type_and_word) > 2:
-                        type_and_word = [type_and_word[0], type_and_word[2]]
-                    row["german"], row["type"] = type_and_word
-                    row["type"] = row["type"].strip()
-                    row["german"] = row["german"].strip()
-                        
-                if row["type"] in Netzverb.verbs: 
-                    base_form = Netzverb.get_word(soup)
-                    if isinstance(base_form, str):
-                        row["german"] = base_form
-
-                # Fill translations and other data
-                row["translation"] = Netzverb.get_translation(soup, settings["main_lang"]["code"])
-                if "second_translation" in self.data.columns:
-                    row["second_translation"] = Netzverb.get_translation(soup, settings["second_lang"]["code"])
-                if "example" in self.data.columns:
-                    row["example"] = Netzverb.get_example(soup, settings["examples"])
-                if "meaning" in self.data.columns:
-                    row["meaning"] = Netzverb.get_meaning(soup, settings["meanings"])
-                    
-                success_count += 1
-            except TranslationError as te:
-                if te.found == False: row["__drop__"] = True
-                failed_words.append(f"{row['german']} ({te})")
-            return row
-
-        # Apply processing function to all rows
-        self.data = self.data.apply(process_row, axis=1)
-        # Delete bad values from df
-        self.data = self.data[self.data["__drop__"] != True]
-        self.data = self.data.drop(columns="__drop__")
-
-        if callback: 
+        options = settings.get("netzverb", {})
+        NetzClient.configure(options)
+        workers = max(int(options.get("workers", 4)), 1)
+        parse_workers = max(int(options.get("parse_workers", 0)), 0) # 0 - pages are parsed in the download threads
+        db = self.importer.db
+        results: dict[int, tuple[int | None, str | None]] = {} # job id -> (rowid, error), ids follow the input order
+
+        def fetch(job: dict) -> tuple[dict | None, Exception | None]:
+            # Download and parse on a worker thread, the run loop stores the record
+            try: return self.translate_word(job, settings, parse), None
+            except Exception as e: return None, e
+
+        def store(job: dict, record: dict | None, error: Exception | None):
+            # Called in claim order, so vocabulary rowids follow the order of the words
+            rowid = None
+            if error is None:
+                try: rowid = db.finish_job(job["id"], record, job["target_rowid"])
+                except Exception as e: error = e
+            if isinstance(error, TranslationError):
+                if not error.found: db.drop_job(job["id"]) # not on Netzverb, retrying will not help
+                elif error.retry and job["attempts"] < self.max_attempts:
+                    db.fail_job(job["id"], str(error), retry_at=time() + self.backoff(job["attempts"]))
+                    return # back in the queue, not done yet
+                else: db.fail_job(job["id"], str(error))
+            elif error is not None: # unexpected page layout, retrying will not help either
+                db.fail_job(job["id"], f"{type(error).__name__}: {error}")
+
+            results[job["id"]] = (rowid, None if error is None else f"{job['german']} ({error})")
+            if progress_callback: progress_callback(len(results), max(words_count_start, len(results)))
+
+        with Translator._run_lock: # a resumed run and a new one never overlap
+            known_count = db.resolve_known_jobs() # no request for words the vocabulary has already
+            if known_count: print(f"[INFO] Skipped {known_count} words already in vocabulary, no fetch needed")
+            words_count_start = db.count_jobs().get("pending", 0)
+            # Large batches parse in worker processes. Download threads hand the raw page
+            # to the pool and wait for the small NetzRecord back, so at most one page per
+            # thread is held in memory and downloads pause while parsing lags behind.
+            if parse_workers > 1 and words_count_start >= int(options.get("parse_pool_min_words", 50)):
+                parse = self._pool_parser(parse_workers)
+            else: parse, parse_workers = NetzParser.parse, 0
+            threads = workers + parse_workers
+
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                while True:
+                    jobs = db.claim_jobs(threads * 4, time())
+                    if not jobs:
+                        next_attempt = db.next_job_time()
+                        if next_attempt is None: break # queue is empty
+                        sleep(min(max(next_attempt - time(), 0.05), self.backoff_max)) # wait for the next retry
+                        continue
+                    # map yields in job order while later pages are still downloading
+                    for job, (record, error) in zip(jobs, executor.map(fetch, jobs)): store(job, record, error)
+            db.clear_done_jobs()
+
+        ordered = [results[job_id] for job_id in sorted(results)] # retried words back in their input place
+        rowids = [rowid for rowid, error in ordered if error is None]
+        failed_words = [error for _, error in ordered if error is not None]
+        if callback:
             callback(success = True, data={
-                "success_count": success_count,
-                "words_count"  : original_shape,
-                "failed_words" : failed_words
+                "success_count": len(rowids),
+                "words_count"  : max(words_count_start, len(results)),
+                "failed_words" : failed_words,
+                "rowids"       : rowids,
+                "known_count"  : known_count
             })
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+import flet as ft
+
+class ViewCache:
+    # Built views are kept per route and dropped only when something they show changes
+    dependencies = {
+        "/":            {"data": True,  "settings": {"day_word"}},
+        "/table":       {"data": True,  "settings": {"columns"}},
+        "/flash":       {"data": False, "settings": {"flashcards", "cards_in_deck"}},
+        "/translation": {"data": False, "settings": {"main_lang", "second_lang", "examples", "meanings", "netzverb", "nlp"}},
+        "/settings":    {"data": False, "settings": set()},
+    }
+
+    def __init__(self):
+        self._views: dict[str, ft.View] = {}
+        self._dirty: set[str] = set() # views changed while on screen, rebuilt on the next visit
+
+    def get(self, route: str) -> ft.View | None:
+        if route in self._dirty: self.invalidate(route)
+        return self._views.get(route)
+
+    def put(self, route: str, view: ft.View):
+        if route in self.dependencies:
+            self._views[route] = view
+            self._dirty.discard(route)
+
+    def invalidate(self, route: str):
+        self._views.pop(route, None)
+        self._dirty.discard(route)
+
+    def _stale(self, route: str, current_route: str = None):
+        # The view on screen stays as it is, background changes (resumed translations,
+        # a new day word) may not show in it, so it is rebuilt once the user comes back
+        if route == current_route:
+            if route in self._views: self._dirty.add(route)
+        else: self.invalidate(route)
+
+    def on_data_changed(self, current_route: str = None):
+        for route, deps in self.dependencies.items():
+            if deps["data"]: self._stale(route, current_route)
+
+    def on_settings_saved(self, keys: set[str], current_route: str = None):
+        for route, deps in self.dependencies.items():
+            if deps["settings"] & keys: self._stale(route, current_route)
@@ -0,0 +1,16 @@
+import pytest
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    # DBManager keeps the database in ~/.vocab_app, every test gets its own home
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+@pytest.fixture
+def db(home):
+    from services.DB_manager import DBManager
+    return DBManager()
+
+def word(german: str, word_type: str = "der", **values) -> dict:
+    return {"type": word_type, "german": german, "translation": f"{german.lower()} (en)", "second_translation": None,
+            "example": None, "meaning": None, "score": 0, **values}
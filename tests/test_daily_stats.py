@@ -0,0 +1,50 @@
+from datetime import date, datetime, time as day_time, timedelta
+from types import SimpleNamespace
+from pandas import DataFrame
+from conftest import word
+from services.migrations import MIGRATIONS
+from services.home_helpers import Statistics
+
+def review(rowid: int, old_score: int, score: int, at: float) -> dict:
+    return {"rowid": rowid, "reviewed_at": at, "old_score": old_score, "score": score, "latency": None,
+            "due": at, "interval": 1.0, "ease": 2.5, "lapses": 0, "reps": 1}
+
+def test_learned_counts_good_and_easy_answers(db):
+    hund, katze, haus = db.insert_data([word("Hund"), word("Katze", "die"), word("Haus", "das")])
+    now = datetime.now().timestamp()
+    db.log_reviews([
+        review(hund, 0, 1, now),  # Hard: correct, not learned yet
+        review(hund, 1, 2, now),  # Good: learned
+        review(katze, 0, 3, now), # Easy: learned
+        review(haus, 0, -1, now), # Repeat
+        review(katze, 3, 2, now), # learnt already
+    ])
+    today = date.today().isoformat()
+    stats = db.fetch_period_stats(today, today)
+    assert (stats["reviews"], stats["correct"], stats["learned"]) == (5, 4, 2)
+
+def test_learned_recount(db):
+    # Migration 12 recounts days logged with the old "answer other than Repeat" rule
+    rowid = db.insert_data(word("Hund"))[0]
+    earlier = datetime.combine(date(2024, 5, 1), day_time(12)).timestamp()
+    db.log_reviews([review(rowid, 0, 1, earlier), review(rowid, 1, 3, earlier)])
+    with db.conn.write() as connection:
+        connection.execute("UPDATE daily_stats SET learned = 1 + learned, total_learned = 1 + total_learned;")
+        for step in MIGRATIONS[12 - 1]: connection.execute(step)
+    stats = db.fetch_period_stats("2024-05-01", "2024-05-01")
+    assert (stats["reviews"], stats["learned"]) == (2, 1)
+    assert db.fetch_daily_stats("2024-05-01", date.today().isoformat())["total_learned"].iloc[-1] == 1
+
+def test_vocabulary_history_before_first_row():
+    # Vocabulary imported before the rollups existed: days before the first row show its size, not 0
+    first = (date.today() - timedelta(days=3)).isoformat()
+    rows = DataFrame([{"day": first, "reviews": 2, "correct": 1, "learned": 0, "total_reviews": 2, "total_correct": 1,
+                       "total_learned": 0, "nouns": 40, "verbs": 30, "adjectives": 20, "other": 10}]).set_index("day")
+    counts = {"all_words": 100, "duplicates": 0, "nulls": 0, "new": 100, "repeat": 0, "learnt": 0,
+              "nouns": 40, "verbs": 30, "adjectives": 20, "other": 10}
+    df_manager = SimpleNamespace(get_stats=lambda: counts, get_daily_stats=lambda start, end: rows,
+                                 get_period_stats=lambda start, end: {"reviews": 2, "learned": 0, "correct": 1})
+    history = Statistics(df_manager).history
+    assert (history["nouns"] == 40).all() and (history["other"] == 10).all()
+    assert history.loc[history.index < first, "total_reviews"].eq(0).all()
+    assert history.loc[first:, "total_reviews"].eq(2).all()
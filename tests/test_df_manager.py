@@ -0,0 +1,74 @@
+import flet as ft
+import pytest
+from conftest import word
+from services.DF_manager import DFManager
+from services.scheduler import Scheduler
+
+@pytest.fixture
+def df_manager(db):
+    db.insert_data([word("Hund"), word("laufen", "VERB"), word("schnell", "ADJ")])
+    return DFManager(verify=True)
+
+def test_create_new_record(df_manager):
+    df_manager.create_new_record(word("Katze", "die"))
+    assert "Katze" in df_manager.data["german"].tolist()
+    assert df_manager.check_consistency()
+
+def test_create_new_record_with_new_type(df_manager):
+    df_manager.create_new_record(word("oder", "CCONJ"))
+    assert df_manager.data["type"].tolist()[-1] == "CCONJ"
+    assert df_manager.check_consistency()
+
+def test_update_record(df_manager):
+    rowid = int(df_manager.data.index[0])
+    container = ft.Container(data={"rowid": rowid}, content=ft.Row([
+        ft.Text("das", data={"col": "type"}),
+        ft.Text("Haus", data={"col": "german"}),
+        ft.Text("-", data={"col": "translation"}), # "-" is stored as NULL
+    ]))
+    df_manager.update_record(container)
+    assert df_manager.data.loc[rowid, "german"] == "Haus"
+    assert df_manager.check_consistency()
+
+def test_delete_rows(df_manager):
+    rowid = int(df_manager.data.index[1])
+    df_manager.delete_rows([rowid])
+    assert rowid not in df_manager.data.index
+    assert df_manager.check_consistency()
+
+def test_add_rows(df_manager):
+    # Rows written by someone else (translation workers): new ones and refreshed ones
+    new_rowids = df_manager.db.insert_data([word("Maus", "die"), word("gehen", "VERB")])
+    refreshed = int(df_manager.data.index[0])
+    df_manager.db.update_data({"rowid": refreshed, "translation": "dog, hound"})
+    df_manager.add_rows([*new_rowids, refreshed])
+    assert set(new_rowids) <= set(df_manager.data.index)
+    assert df_manager.data.loc[refreshed, "translation"] == "dog, hound"
+    assert df_manager.check_consistency()
+
+def test_review(df_manager):
+    rowid = int(df_manager.data.index[2])
+    card = df_manager.data.loc[rowid]
+    schedule = Scheduler.review(card, 2, 1_000_000.0)
+    df_manager.review(rowid, int(card["score"]), schedule, latency=1.5)
+    df_manager.flush_reviews()
+    assert df_manager.data.loc[rowid, "score"] == 2
+    assert df_manager.check_consistency()
+
+def test_check_consistency_detects_drift(df_manager):
+    df_manager.data.loc[df_manager.data.index[0], "german"] = "changed only in memory"
+    assert not df_manager.check_consistency()
+
+def test_fetch_rows_display_columns(db):
+    rowids = db.insert_data([word("Hund"), word("Katze", "die")])
+    rows = db.fetch_rows(rowids, columns=list(db.display_columns))
+    assert list(rows.columns) == list(db.display_columns) # no due/interval/ease/lapses/reps in previews
+    assert rows["german"].tolist() == ["Hund", "Katze"]
+
+def test_sorted_pages_skip_rows_not_in_frame(df_manager):
+    # A running translation stores rows before add_rows brings them into the frame
+    stored = df_manager.db.insert_data([word("Apfel")])[0]
+    rowids = [rowid for page in df_manager.sorted_pages("german", page_size=2) for rowid in page]
+    assert stored not in rowids
+    assert sorted(rowids) == sorted(df_manager.data.index)
+    df_manager.data.loc[rowids] # every rowid can be rendered
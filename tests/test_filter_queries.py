@@ -0,0 +1,42 @@
+import itertools
+import pytest
+from conftest import word
+
+TYPES = ["der", "die", "das", "NOUN", "VERB", "AUX", "ADJ", "ADV", "CCONJ", "X"]
+FILTER_GROUPS = {"TYPE": ["noun", "verb", "adjective", "other"], "special": ["duplicates", "nulls"]}
+MODES = ["duplicates", "nulls", "new", "repeat", "learnt", "nouns", "verbs", "adjectives", "other"]
+
+@pytest.fixture
+def analyzed_db(db):
+    # mixed vocabulary with planner stats, broad filters are where SQLite prefers a table scan
+    db.insert_data([word(f"Wort{i}", TYPES[i % len(TYPES)], score=i % 4, translation=None if i % 9 == 0 else f"word{i}")
+                    for i in range(3000)])
+    with db.conn.write() as connection:
+        connection.execute("ANALYZE")
+    return db
+
+def plan(db, query: str) -> list[str]:
+    with db.conn.read() as connection:
+        return [row[3] for row in connection.execute("EXPLAIN QUERY PLAN " + query.strip().rstrip(";"))]
+
+def filter_cases():
+    cases = [("type", ["der"]), ("type", ["der", "VERB"]), ("score", ["0"]), ("score", ["-1", "1"])]
+    for category, values in FILTER_GROUPS.items():
+        for n in range(1, len(values) + 1):
+            cases += [(category, list(combo)) for combo in itertools.combinations(values, n)]
+    return cases
+
+@pytest.mark.parametrize("filter_tuple", filter_cases(), ids=str)
+def test_filter_query_uses_index(analyzed_db, filter_tuple):
+    assert "SCAN vocabulary" not in plan(analyzed_db, analyzed_db.create_filter_query(filter_tuple))
+
+@pytest.mark.parametrize("mode", MODES)
+def test_fetch_data_uses_index(analyzed_db, mode):
+    assert "SCAN vocabulary" not in plan(analyzed_db, analyzed_db.fetch_data(mode, just_return_query=True))
+
+def test_type_filter_matches_rows(analyzed_db):
+    with analyzed_db.conn.read() as connection:
+        rows = connection.execute(analyzed_db.create_filter_query(("TYPE", ["noun", "other"]))).fetchall()
+    types = {row[1] for row in rows}
+    assert types == {"der", "die", "das", "NOUN", "CCONJ", "X"}
+    assert len(rows) == len({row[0] for row in rows}) # no row listed twice
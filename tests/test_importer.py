@@ -0,0 +1,51 @@
+import tracemalloc
+from services.importer import Importer
+
+def write_word_list(path, lines: int):
+    # Article-prefixed nouns, the importer does not need the spaCy tagger for them
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines): f.write(f"der Wort{i}\n")
+    return path
+
+def import_peak(db, path) -> tuple[dict, int]:
+    tracemalloc.start()
+    try:
+        stats = Importer(db).import_file(path)
+        return stats, tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+
+def test_noun_type():
+    assert Importer.noun_type(" Der Hund ") == ("der", "Hund")
+    assert Importer.noun_type("laufen") == (None, "laufen")
+
+def test_import_text_skips_repeats(db):
+    stats = Importer(db).import_text("der Hund, die Katze; der Hund\tdas Haus")
+    assert stats == {"read": 4, "existing": 0, "staged": 3}
+
+def test_import_memory_is_flat(db, tmp_path):
+    # Peak memory follows chunk_size, not the number of lines in the file
+    small_stats, small_peak = import_peak(db, write_word_list(tmp_path / "small.txt", 50_000))
+    db.clear_staged()
+    large_stats, large_peak = import_peak(db, write_word_list(tmp_path / "large.txt", 500_000))
+    assert small_stats["staged"] == 50_000 and large_stats["staged"] == 500_000
+    assert large_peak < small_peak * 1.5
+    assert large_peak < 8 * 1024 * 1024
+
+def test_staged_words_wait_for_translate(db):
+    Importer(db).import_text("der Hund, die Katze")
+    assert db.count_jobs() == {"staged": 2} # not resumed on startup
+    assert db.claim_jobs(10, now=0) == []
+    assert db.start_staged_jobs() == 2
+    assert [job["german"] for job in db.claim_jobs(10, now=0)] == ["Hund", "Katze"]
+
+def test_staged_preview_is_capped(db):
+    importer = Importer(db)
+    importer.import_text(", ".join(f"das Wort{i}" for i in range(1200)))
+    db.start_staged_jobs()
+    job = db.claim_jobs(1, now=0)[0]
+    db.fail_job(job["id"], "timeout")
+    preview = importer.staged(500)
+    assert len(preview) == 500
+    assert preview["status"].iloc[0] == "failed" # failed words first, then in input order
+    assert preview["german"].iloc[1:3].tolist() == ["Wort1", "Wort2"]
+    assert importer.counts() == {"pending": 1199, "failed": 1}
@@ -0,0 +1,25 @@
+import pytest
+from services.netz_cache import ResponseCache
+from services.netz_client import NetzClient
+from services.translator import Netzverb, TranslationError
+
+@pytest.fixture
+def offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(NetzClient, "cache", ResponseCache(tmp_path / "cache"))
+    monkeypatch.setattr(NetzClient, "offline", True)
+    return NetzClient.cache
+
+def test_ttl_override(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put("https://example.org/a", b"page")
+    assert cache.get("https://example.org/a") == b"page"
+    assert cache.get("https://example.org/a", ttl=0) is None # expired for a zero ttl
+
+def test_offline_miss_is_not_retried(offline):
+    with pytest.raises(TranslationError) as error:
+        Netzverb.get_content("Hund", "der")
+    assert error.value.found and not error.value.retry
+
+def test_offline_serves_random_words_from_cache(offline):
+    offline.put(Netzverb.random_url, b'<nav class="rBox rBoxWht"><p><a>Baum</a><a>Haus</a></p></nav>')
+    assert Netzverb.get_random_words() == ["Baum", "Haus"]
@@ -0,0 +1,68 @@
+from pathlib import Path
+from re import compile
+import pytest
+from bs4 import BeautifulSoup
+from services.netz_parser import NetzParser, PARSER
+
+PAGES = sorted((Path(__file__).parent / "fixtures" / "netzverb").glob("*.html"))
+LANGS = ["en", "ru", "es", "fr", "nn"]
+
+# Reference: the per-field soup extractors Netzverb used before NetzParser
+def legacy_present(soup: BeautifulSoup) -> bool:
+    return soup.find("h1", string=compile(r"^Definition")) is not None
+
+def legacy_translation(soup: BeautifulSoup, lang_code: str):
+    if lang_code == "nn": return None
+    dd = soup.find("dd", lang=lang_code)
+    if not dd: return None
+    spans = dd.find_all("span")
+    if len(spans) < 2: return None
+    words = [word.strip() for word in spans[1].text.split(",")]
+    return ", ".join(words[:4])
+
+def legacy_example(soup: BeautifulSoup, n: int):
+    if n == 0: return None
+    examples = [tag["href"].split("=")[1] for tag in soup.find_all("a", href=True)
+                if tag["href"].startswith("https://www.satzapp.de/?t=")]
+    return "; ".join(examples[:n])
+
+def legacy_meaning(soup: BeautifulSoup, n: int):
+    if n == 0: return None
+    meanings = []
+    for section in soup.find_all("section", class_="rBox rBoxWht"):
+        h2 = section.find("h2")
+        if h2 and h2.text == "Bedeutungen":
+            dl = section.find("dl", class_="wNrn")
+            if dl:
+                for dd in dl.find_all("dd"):
+                    text = dd.text.strip()
+                    if text.startswith(("a.", "b.", "c.", "d.", "e.")): text = text[2:]
+                    meanings.extend(part.strip() for part in text.split(";") if part.strip())
+                return "; ".join(meanings[:n])
+    return None
+
+def legacy_word(soup: BeautifulSoup):
+    div = soup.find("div", class_="rCntr rClear")
+    return div.text.strip() if div else None
+
+@pytest.mark.parametrize("strain", [True, False])
+@pytest.mark.parametrize("page", PAGES, ids=lambda page: page.stem)
+def test_parser_matches_legacy_extractors(page, strain, monkeypatch):
+    monkeypatch.setattr(NetzParser, "strain", strain)
+    content = page.read_bytes()
+    soup = BeautifulSoup(content, PARSER)
+    record = NetzParser.parse(content)
+
+    assert record.present == legacy_present(soup)
+    assert record.word == legacy_word(soup)
+    for lang in LANGS:
+        assert record.translation(lang) == legacy_translation(soup, lang)
+    for n in range(4):
+        assert record.example(n) == legacy_example(soup, n)
+        assert record.meaning(n) == legacy_meaning(soup, n)
+
+def test_fixture_pages():
+    hund = NetzParser.parse((Path(__file__).parent / "fixtures" / "netzverb" / "hund.html").read_bytes())
+    assert hund.present and hund.word == "Hund, der"
+    assert hund.translation("en") == "dog, hound, canine, cur"
+    assert hund.meaning(3) == "Haustier, das vom Wolf abstammt; bellendes Tier; gemeiner Kerl, Schuft"
@@ -0,0 +1,36 @@
+import random
+from time import sleep
+
+from services.importer import Importer
+from services.translator import TranslationError, Translator
+
+SETTINGS = {"netzverb": {"workers": 4}, "second_lang": {"lang": "None"}, "examples": 0, "meanings": 0,
+            "main_lang": {"code": "en"}}
+
+def slow_translate(self, job, settings, parse=None):
+    # Pages finish in random order, like downloads of different size
+    sleep(random.uniform(0, 0.02))
+    if job["german"].startswith("Missing"): raise TranslationError("Word not found on Netzverb", False)
+    if job["german"].startswith("Broken"): raise ValueError("no translation table")
+    return {"type": job["type"], "german": job["german"], "translation": job["german"].lower(), "score": 0}
+
+def test_results_follow_input_order(db, monkeypatch):
+    random.seed(7)
+    monkeypatch.setattr(Translator, "translate_word", slow_translate)
+    words = [f"Missing{i}" if i % 7 == 3 else f"Broken{i}" if i % 11 == 5 else f"Wort{i}" for i in range(60)]
+    Importer(db).import_text(", ".join(f"das {german}" for german in words))
+    db.start_staged_jobs()
+
+    translator = Translator()
+    translator.importer = Importer(db)
+    progress, result = [], {}
+    translator.get_netz_info(SETTINGS, lambda done, total: progress.append(done),
+                             lambda success, data: result.update(data))
+
+    expected = [german for german in words if german.startswith("Wort")]
+    stored = db.fetch_rows(result["rowids"], columns=["german"])["german"].tolist()
+    assert stored == expected
+    assert result["rowids"] == sorted(result["rowids"]) # inserted in claim order
+    assert result["failed_words"] == [f"{german} ({'Word not found on Netzverb' if german.startswith('Missing') else 'no translation table'})"
+                                      for german in words if not german.startswith("Wort")]
+    assert progress == list(range(1, len(words) + 1))
@@ -0,0 +1,26 @@
+import flet as ft
+from services.view_cache import ViewCache
+
+def cache_with(*routes) -> ViewCache:
+    cache = ViewCache()
+    for route in routes: cache.put(route, ft.View(route=route))
+    return cache
+
+def test_data_change_drops_other_views():
+    cache = cache_with("/", "/table", "/flash")
+    cache.on_data_changed("/flash")
+    assert cache.get("/") is None and cache.get("/table") is None
+    assert cache.get("/flash") is not None
+
+def test_current_view_is_rebuilt_on_next_visit():
+    cache = cache_with("/", "/table")
+    cache.on_data_changed("/table") # e.g. resumed translations while the table is open
+    assert cache.get("/table") is None # rebuilt when the user comes back
+    cache.put("/table", ft.View(route="/table"))
+    assert cache.get("/table") is not None
+
+def test_settings_saved_marks_current_view():
+    cache = cache_with("/", "/flash")
+    cache.on_settings_saved({"day_word"}, "/") # DayWord refill saves settings on the home screen
+    assert cache.get("/flash") is not None
+    assert cache.get("/") is None